@@ -14,6 +14,7 @@
 
 import dataclasses
 import inspect
+import sys
 from typing import TypeVar, List, Any, Callable, Type, Optional, Generic, Tuple, Union, Set
 
 from grundzeug.container import IContainer
@@ -32,6 +33,12 @@ CONFIGURATION_METADATA_KEY = "GRUNDZEUG_CONFIGURATION_METADATA"
 _MISSING_TYPE, MISSING = make_sentinel()
 
 
+def _intern_path(path: ConfigPathT) -> CanonicalConfigPathT:
+    # Config paths are compared against the keys of provider dictionaries on every lookup. Interned segments make
+    # those comparisons succeed on the identity check, without comparing the characters.
+    return tuple(sys.intern(x) if type(x) is str else x for x in path)
+
+
 @dataclasses.dataclass(frozen=True)
 class ConfigurationValidationException(Exception):
     """
@@ -67,6 +74,10 @@ class MissingConfigurationKeysException(Exception):
 
 
 class _ConfigurableMetadata():
+    # There is one of these for every Configurable of every configuration class.
+    __slots__ = ("path", "default", "description", "owner_class", "field_name", "override_config_path", "_full_path",
+                 "validation_rules", "clazz")
+
     def __init__(
             self,
             path: ConfigPathT,
@@ -77,12 +88,17 @@ class _ConfigurableMetadata():
             owner_class=None,
             validation_rules=None
     ):
-        self.path: CanonicalConfigPathT = tuple(path)
+        self.path: CanonicalConfigPathT = _intern_path(path)
         self.default = default
         self.description = description
         self.owner_class = owner_class
         self.field_name = None
         self.override_config_path = override_config_path
+        self._full_path: Optional[CanonicalConfigPathT] = None
+        if owner_class is not None:
+            # Configurables get their owner class when @configuration copies them, so the full path can be computed
+            # once here instead of on the first resolution.
+            self._full_path = self._compute_full_path()
 
         if validation_rules is not None:
             self.validation_rules: List[Callable[[ConfigT], None]] = validation_rules
@@ -111,6 +127,15 @@ class _ConfigurableMetadata():
         """
         :return: The full path to the configuration value.
         """
+        if self._full_path is None:
+            # Both the owner class's path and this configurable's path are immutable, so the result can be reused.
+            self._full_path = self._compute_full_path()
+        return self._full_path
+
+    def _compute_full_path(self) -> CanonicalConfigPathT:
+        # Full paths are used as dictionary keys all over the configuration machinery. They are kept as plain tuples:
+        # the hashes of their strings are cached by the interpreter, and a tuple subclass with a cached __hash__ would
+        # make every lookup slower by going through a Python-level call.
         return tuple(self.owner_class.__grundzeug_configuration__.path + self.path)
 
     @property
@@ -125,6 +150,8 @@ class _ConfigurableMetadata():
 
 
 class Configurable(Generic[ConfigT]):
+    __slots__ = ("configurable_metadata", "__weakref__")
+
     def __init__(
             self,
             path: ConfigPathT,
@@ -197,6 +224,9 @@ class Configurable(Generic[ConfigT]):
 
     def __class_getitem__(cls, item):
         class _Configurable(Configurable):
+            # Without this, the subclass would bring back the per-instance __dict__ that the base class avoids.
+            __slots__ = ()
+
             def __init__(
                     self,
                     path: ConfigPathT,
@@ -242,6 +272,11 @@ register_contract_to_type_converter(
 class ConfigurationClassMetadata():
     path: CanonicalConfigPathT
     original_class: type
+    fields: Tuple[Tuple[str, "Configurable"], ...] = ()
+    """
+    The names and :py:class:`~grundzeug.config.common.Configurable` instances of all configurable fields of the \
+    configuration class, including inherited ones.
+    """
 
 
 def configuration(path: Union[ConfigPathT, type]):
@@ -256,13 +291,15 @@ def configuration(path: Union[ConfigPathT, type]):
     def _configurationclass(_cls: type):
         if "__grundzeug_configuration__" in _cls.__dict__:
             _cls = _cls.__dict__["__grundzeug_configuration__"].original_class
+        metadata = ConfigurationClassMetadata(
+            path=_intern_path(path),
+            original_class=_cls
+        )
         _clsCopy = type(f"{_cls.__name__}___{'_'.join(path)}", (_cls,), {
-            "__grundzeug_configuration__": ConfigurationClassMetadata(
-                path=tuple(path),
-                original_class=_cls
-            )
+            "__grundzeug_configuration__": metadata
         })
 
+        fields = {}
         for t in reversed(inspect.getmro(_clsCopy)):
             for k, v in t.__dict__.items():
                 if not isinstance(v, Configurable):
@@ -278,6 +315,7 @@ def configuration(path: Union[ConfigPathT, type]):
                     _validation_rules=v.configurable_metadata.validation_rules
                 )
                 v2.configurable_metadata.field_name = k
+                fields[k] = v2
 
                 setattr(
                     _clsCopy,
@@ -285,13 +323,15 @@ def configuration(path: Union[ConfigPathT, type]):
                     v2
                 )
 
+        # Collect the fields once, so that neither resolution nor asdict has to scan the class's namespace.
+        _clsCopy.__grundzeug_configuration__ = dataclasses.replace(metadata, fields=tuple(fields.items()))
+
         def _asdict(self):
-            res = {}
-            for k, v in type(self).__dict__.items():
-                if not isinstance(v, Configurable):
-                    continue
-                res[k] = getattr(self, k)
-            return res
+            return {
+                k: getattr(self, k)
+                for k, _
+                in type(self).__grundzeug_configuration__.fields
+            }
 
         _clsCopy.asdict = _asdict
         return _clsCopy
@@ -12,53 +12,74 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from argparse import ArgumentParser
-from typing import Type, Set, Dict, Any
+from dataclasses import dataclass
+from typing import Type, Set, Dict, Any, List, FrozenSet, TYPE_CHECKING
 
-from grundzeug.config.common import ConfigT, Configurable, ConfigPathT, MISSING
+from grundzeug.config.common import ConfigT, Configurable, ConfigPathT, MISSING, CanonicalConfigPathT
 from grundzeug.config.providers.common import ConfigurationProvider
 
+if TYPE_CHECKING:
+    # argparse (and gettext, which it pulls in) is only needed by the caller, who constructs the parser.
+    from argparse import ArgumentParser
+
+
+@dataclass(frozen=True)
+class _ArgumentSpec:
+    option: str
+    dest: str
+    full_path: CanonicalConfigPathT
+    configurable: Configurable
+
 
 class ArgParseConfigurationProvider(ConfigurationProvider):
     def __init__(self, prefix: str = "D"):
         self.prefix = prefix
         self._managed_configurations: Set[Type] = set()
-        self._dict: Dict[str, Any] = {}
+        self._argument_specs: List[_ArgumentSpec] = []
+        self._values: Dict[CanonicalConfigPathT, Any] = {}
+        self._available_keys: FrozenSet[CanonicalConfigPathT] = frozenset()
 
     def manage_configuration(self, config_type: Type[ConfigT]):
         assert hasattr(config_type, "__grundzeug_configuration__")
+        if config_type in self._managed_configurations:
+            return
         self._managed_configurations.add(config_type)
+        # The option names are derived once here and shared by register_arguments and process_parsed_arguments.
+        for k, v in config_type.__grundzeug_configuration__.fields:
+            full_path = v.configurable_metadata.full_path
+            dest = self.prefix + ".".join(full_path)
+            self._argument_specs.append(_ArgumentSpec(
+                option=f"--{dest}",
+                dest=dest,
+                full_path=full_path,
+                configurable=v
+            ))
 
-    def register_arguments(self, argument_parser: ArgumentParser):
-        for config_type in self._managed_configurations:
-            for k, v in config_type.__dict__.items():
-                if not isinstance(v, Configurable):
-                    continue
-                full_path_joined = ".".join(v.configurable_metadata.full_path)
-                argument_parser.add_argument(
-                    f"--{self.prefix}{full_path_joined}",
-                    default=MISSING,
-                    type=v.configurable_metadata.clazz,
-                    help=v.configurable_metadata.description,
-                    required=False
-                )
+    def register_arguments(self, argument_parser: "ArgumentParser"):
+        for spec in self._argument_specs:
+            argument_parser.add_argument(
+                spec.option,
+                dest=spec.dest,
+                default=MISSING,
+                type=spec.configurable.configurable_metadata.clazz,
+                help=spec.configurable.configurable_metadata.description,
+                required=False
+            )
 
     def process_parsed_arguments(self, value):
-        for config_type in self._managed_configurations:
-            for k, v in config_type.__dict__.items():
-                if not isinstance(v, Configurable):
-                    continue
-                full_path_joined = ".".join(v.configurable_metadata.full_path)
-                val = getattr(value, self.prefix + full_path_joined)
-                if val == MISSING:
-                    continue
-                self._dict[full_path_joined] = val
+        for spec in self._argument_specs:
+            val = getattr(value, spec.dest)
+            if val is MISSING:
+                continue
+            self._values[spec.full_path] = val
+        # The keys are queried on every resolution, so the set is only rebuilt when the values change.
+        self._available_keys = frozenset(self._values)
 
     def get_value(self, path: ConfigPathT):
-        joined_path = ".".join(path)
-        if joined_path in self._dict:
-            return self._dict[joined_path]
-        return MISSING
+        return self._values.get(tuple(path), MISSING)
+
+    def available_keys(self) -> FrozenSet[CanonicalConfigPathT]:
+        return self._available_keys
 
 
 __all__ = ["ArgParseConfigurationProvider"]
@@ -12,9 +12,10 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import sys
 from abc import abstractmethod
 from pathlib import Path
-from typing import TextIO, Union, Any
+from typing import TextIO, Union, Any, Optional, AbstractSet, FrozenSet, Dict
 
 from typing_extensions import Literal
 
@@ -35,6 +36,17 @@ class ConfigurationProvider:
         """
         raise NotImplementedError()
 
+    def available_keys(self) -> Optional[AbstractSet[CanonicalConfigPathT]]:
+        """
+        Providers that can cheaply enumerate their contents may override this method so that only the config paths
+        they actually have are queried using :py:meth:`~grundzeug.config.providers.common.ConfigurationProvider.get_value`.
+
+        :return: The set of config paths (keys) for which \
+                 :py:meth:`~grundzeug.config.providers.common.ConfigurationProvider.get_value` doesn't return \
+                 :py:const:`~grundzeug.config.common.MISSING`, or ``None`` if this provider can't enumerate them.
+        """
+        return None
+
 
 class TextParserConfigurationProviderMixin:
     """
@@ -95,6 +107,10 @@ class DictTreeConfigurationProvider(ConfigurationProvider):
                      be resolved by indexing ``root`` as follows: ``root["foo"]["bar"]["baz"]``.
         """
         self._dict = root
+        self._available_keys: Optional[FrozenSet[CanonicalConfigPathT]] = None
+        # Maps every config path in the tree (including the empty path) to its value, so that queries don't have to
+        # walk the nested dictionaries. Built lazily and discarded whenever the tree is modified.
+        self._flat: Optional[Dict[CanonicalConfigPathT, Any]] = None
 
     def set_value(
             self,
@@ -116,14 +132,36 @@ class DictTreeConfigurationProvider(ConfigurationProvider):
             current_dictionary = current_dictionary[name]
 
         current_dictionary[reference[-1]] = value
+        self._available_keys = None
+        self._flat = None
+
+    def _flatten(self) -> Dict[CanonicalConfigPathT, Any]:
+        if self._flat is None:
+            flat = {(): self._dict}
+            stack = [((), self._dict)]
+            while len(stack) != 0:
+                prefix, dictionary = stack.pop()
+                for name, value in dictionary.items():
+                    if type(name) is str:
+                        # Configurable paths are interned too, so looking them up only takes an identity check.
+                        name = sys.intern(name)
+                    path = prefix + (name,)
+                    flat[path] = value
+                    if isinstance(value, dict):
+                        stack.append((path, value))
+            self._flat = flat
+        return self._flat
 
     def get_value(self, path: ConfigPathT):
-        cur = self._dict
-        for x in path:
-            if x not in cur:
-                return MISSING
-            cur = cur[x]
-        return cur
+        flat = self._flat
+        if flat is None:
+            flat = self._flatten()
+        return flat.get(tuple(path), MISSING)
+
+    def available_keys(self) -> FrozenSet[CanonicalConfigPathT]:
+        if self._available_keys is None:
+            self._available_keys = frozenset(path for path in self._flatten() if len(path) != 0)
+        return self._available_keys
 
 
 __all__ = ["ConfigurationProvider", "TextParserConfigurationProviderMixin", "DictTreeConfigurationProvider"]
@@ -11,7 +11,8 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import TYPE_CHECKING, Union, Tuple
+import functools
+from typing import TYPE_CHECKING, Union, Tuple, Optional
 
 from typing_extensions import Annotated
 
@@ -20,15 +21,22 @@ from grundzeug.container.contracts import convert_contract_to_type
 from grundzeug.container.di import InjectAnnotation
 
 
+@functools.lru_cache(maxsize=1024)
+def _make_inject_annotation(contract: ContractT, name: Optional[str]) -> Annotated:
+    # Subscripting Annotated is comparatively expensive, and the resulting annotations are immutable, so recently
+    # requested annotations are reused. The cache is bounded, so that contracts aren't kept alive forever.
+    return Annotated[convert_contract_to_type(contract), InjectAnnotation(contract, name)]
+
+
 class Inject():
     def __class_getitem__(self, contract: ContractT) -> Annotated:
-        return Annotated[convert_contract_to_type(contract), InjectAnnotation[contract]]
+        return _make_inject_annotation(contract, None)
 
 
 class InjectNamed():
     def __class_getitem__(self, contract_and_name: Tuple[ContractT, str]) -> Annotated:
         contract, name = contract_and_name
-        return Annotated[convert_contract_to_type(contract), InjectAnnotation(contract, name)]
+        return _make_inject_annotation(contract, name)
 
 
 __all__ = ["Inject", "InjectNamed"]
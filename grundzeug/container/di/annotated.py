@@ -45,20 +45,26 @@ class AnnotatedTypeIntrospector(TypeIntrospector):
         yield matching_annotations[0]
 
     def inject_fields(self, type_, instance, container: IContainer):
-        field_defs = type_.__dict__.get('__annotations__', {})
-        for k, v in field_defs.items():
-            if not hasattr(v, "__metadata__"):
-                continue
-
-            for annotation in self._process(annotated_type=v):
-                setattr(
-                    instance,
-                    k,
-                    container.resolve_bean(
-                        contract=annotation.bean_contract,
-                        bean_name=annotation.bean_name
-                    )
+        for k, annotation in self.get_fields_to_inject(type_).items():
+            setattr(
+                instance,
+                k,
+                container.resolve_bean(
+                    contract=annotation.bean_contract,
+                    bean_name=annotation.bean_name
                 )
+            )
+
+    def get_fields_to_inject(self, type_) -> Dict[str, InjectAnnotation]:
+        field_defs = type_.__dict__.get('__annotations__', {})
+        return {
+            k: annotation
+            for k, v
+            in field_defs.items()
+            if hasattr(v, "__metadata__")
+            for annotation
+            in self._process(annotated_type=v)
+        }
 
     def get_kwargs_to_inject(self, func, signature: Signature, container: IContainer) -> Dict[str, Any]:
         return {
@@ -66,6 +72,13 @@ class AnnotatedTypeIntrospector(TypeIntrospector):
                 contract=annotation.bean_contract,
                 bean_name=annotation.bean_name
             )
+            for k, annotation
+            in self.get_parameters_to_inject(func, signature).items()
+        }
+
+    def get_parameters_to_inject(self, func, signature: Signature) -> Dict[str, InjectAnnotation]:
+        return {
+            k: annotation
             for k, v
             in signature.parameters.items()
             if hasattr(v.annotation, "__metadata__")
@@ -28,6 +28,31 @@ class TypeIntrospector(ABC):
     def get_kwargs_to_inject(self, func, signature: inspect.Signature, container: IContainer) -> Dict[str, Any]:
         raise NotImplementedError()
 
+    def get_fields_to_inject(self, type_) -> Optional[Dict[str, "InjectAnnotation"]]:
+        """
+        Introspectors whose choice of injected fields only depends on the type may override this method, so that the
+        choice can be made once per type instead of on every instantiation.
+
+        :param type_: The class (one of the classes in the MRO of the instance being injected) to inspect.
+        :return: A dictionary mapping field names declared by ``type_`` to the beans that should be injected into \
+                 them, or ``None`` if :py:meth:`~grundzeug.container.di.common.TypeIntrospector.inject_fields` \
+                 should be called on every injection instead.
+        """
+        return None
+
+    def get_parameters_to_inject(self, func, signature: inspect.Signature) -> Optional[Dict[str, "InjectAnnotation"]]:
+        """
+        Introspectors whose choice of injected parameters only depends on the signature may override this method, so
+        that the choice can be made once per function instead of on every injection.
+
+        :param func: The function that is being injected.
+        :param signature: The signature of ``func``.
+        :return: A dictionary mapping parameter names to the beans that should be injected into them, or ``None`` if \
+                 :py:meth:`~grundzeug.container.di.common.TypeIntrospector.get_kwargs_to_inject` should be called \
+                 on every injection instead.
+        """
+        return None
+
 
 _type_introspectors: List[TypeIntrospector] = []
 
@@ -22,9 +22,7 @@ from grundzeug.container.di.common import TypeIntrospector, InjectAnnotation, re
 class DefaultTypeIntrospector(TypeIntrospector):
 
     def inject_fields(self, type_, instance, container: IContainer):
-        for k, v in type_.__dict__.items():
-            if not isinstance(v, InjectAnnotation):
-                continue
+        for k, v in self.get_fields_to_inject(type_).items():
             setattr(
                 instance,
                 k,
@@ -34,13 +32,28 @@ class DefaultTypeIntrospector(TypeIntrospector):
                 )
             )
 
+    def get_fields_to_inject(self, type_) -> Dict[str, InjectAnnotation]:
+        return {
+            k: v
+            for k, v
+            in type_.__dict__.items()
+            if isinstance(v, InjectAnnotation)
+        }
+
     def get_kwargs_to_inject(self, func, signature: Signature, container: IContainer) -> Dict[str, Any]:
         return {
             k: container.resolve_bean(
-                contract=v.default.bean_contract,
-                bean_name=v.default.bean_name
+                contract=v.bean_contract,
+                bean_name=v.bean_name
             )
             for k, v
+            in self.get_parameters_to_inject(func, signature).items()
+        }
+
+    def get_parameters_to_inject(self, func, signature: Signature) -> Dict[str, InjectAnnotation]:
+        return {
+            k: v.default
+            for k, v
             in signature.parameters.items()
             if isinstance(v.default, InjectAnnotation)
         }
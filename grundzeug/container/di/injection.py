@@ -14,27 +14,69 @@
 
 import functools
 import inspect
-from typing import Any
+from typing import Any, Dict, Optional, Tuple
+from weakref import WeakKeyDictionary
 
 from grundzeug.container.interface import IContainer, ContractT
-from grundzeug.container.di.common import _type_introspectors
-from grundzeug.util.collections import dictionary_union
+from grundzeug.container.di.common import _type_introspectors, InjectAnnotation
 
 
 def injectable(cls: ContractT) -> ContractT:
     class __wrapper(cls):
         def __init__(self, __grundzeug_container: IContainer, *args, **kwargs):
             inject_fields(__grundzeug_container, self)
-            inject(__grundzeug_container, super().__init__)(*args, **kwargs)
+            init = super().__init__
+            init(*args, **{**get_kwargs_to_inject(__grundzeug_container, init), **kwargs})
 
+    # Plan the injection when the class is declared rather than when it is first instantiated.
+    _get_field_injection_plan(__wrapper)
+    if inspect.isfunction(cls.__init__):
+        # The injected __init__ is called as a bound method, so its plan goes where bound methods look it up.
+        _get_method_injection_plan(cls.__init__)
     setattr(cls, "__injectable__", __wrapper)
     return cls
 
 
+# Maps classes to the number of type introspectors the plan was built with and, for each class in the MRO (starting
+# from object) and each type introspector, the fields to inject (or None if the type introspector has to be asked on
+# every injection). The plan mustn't reference the class itself, or the class would never be collected.
+_FieldInjectionPlanT = Tuple[int, Tuple[Tuple[Optional[Dict[str, InjectAnnotation]], ...], ...]]
+_field_injection_plan_cache: "WeakKeyDictionary[type, _FieldInjectionPlanT]" = WeakKeyDictionary()
+
+
+def _build_field_injection_plan(clazz: type) -> _FieldInjectionPlanT:
+    return (
+        len(_type_introspectors),
+        tuple(
+            tuple(type_introspector.get_fields_to_inject(t) for type_introspector in _type_introspectors)
+            for t
+            in reversed(inspect.getmro(clazz))
+        )
+    )
+
+
+def _get_field_injection_plan(clazz: type) -> _FieldInjectionPlanT:
+    plan = _field_injection_plan_cache.get(clazz)
+    if plan is None or plan[0] != len(_type_introspectors):
+        plan = _build_field_injection_plan(clazz)
+        _field_injection_plan_cache[clazz] = plan
+    return plan
+
+
 def inject_fields(container: IContainer, instance: Any):
-    for t in reversed(inspect.getmro(type(instance))):
-        for type_introspector in _type_introspectors:
-            type_introspector.inject_fields(t, instance, container)
+    clazz = type(instance)
+    plan = _get_field_injection_plan(clazz)
+    for t, fields_to_inject in zip(reversed(inspect.getmro(clazz)), plan[1]):
+        for type_introspector, fields in zip(_type_introspectors, fields_to_inject):
+            if fields is None:
+                type_introspector.inject_fields(t, instance, container)
+                continue
+            for k, annotation in fields.items():
+                setattr(
+                    instance,
+                    k,
+                    container.resolve_bean(contract=annotation.bean_contract, bean_name=annotation.bean_name)
+                )
 
 
 def inject(container: IContainer, func):
@@ -42,23 +84,100 @@ def inject(container: IContainer, func):
         func = functools.partial(func.__injectable__, container)
     else:
         to_inject = get_kwargs_to_inject(container, func)
-        func = functools.partial(func, **to_inject)
+        # Most factories don't ask for any beans, and they are injected on every transient resolution.
+        if len(to_inject) != 0:
+            func = functools.partial(func, **to_inject)
     return func
 
 
-def get_kwargs_to_inject(container, func):
-    sig = inspect.signature(func)
-    to_inject = dictionary_union(
-        *(
-            type_introspector.get_kwargs_to_inject(
-                func=func,
-                signature=sig,
-                container=container
-            )
-            for type_introspector
-            in _type_introspectors
-        )
+# Maps functions to the number of type introspectors the plan was built with, the function's signature and, for each
+# type introspector, the parameters it wants to inject (or None if it has to be asked on every injection). If no type
+# introspector has to be asked, the plan also holds the merged (name, contract, bean name) triples to resolve. Type
+# introspectors can only be added, so a change in their number means that the cached plan is stale.
+_InjectionPlanT = Tuple[
+    int,
+    inspect.Signature,
+    Tuple[Optional[Dict[str, InjectAnnotation]], ...],
+    Optional[Tuple[Tuple[str, ContractT, Optional[str]], ...]]
+]
+_injection_plan_cache: "WeakKeyDictionary[Any, _InjectionPlanT]" = WeakKeyDictionary()
+# Bound methods are created anew on every attribute access (e.g. ``super().__init__`` in injectable classes), so they
+# would drop out of the cache above right away. Their signature doesn't depend on the instance they're bound to, so
+# their plans are cached by the underlying function instead.
+_bound_method_injection_plan_cache: "WeakKeyDictionary[Any, _InjectionPlanT]" = WeakKeyDictionary()
+
+
+def _build_injection_plan(func, sig: inspect.Signature) -> _InjectionPlanT:
+    parameters_to_inject = tuple(
+        type_introspector.get_parameters_to_inject(func, sig)
+        for type_introspector
+        in _type_introspectors
     )
+    resolved_parameters = None
+    if all(parameters is not None for parameters in parameters_to_inject):
+        # Later type introspectors take precedence over earlier ones, just like in get_kwargs_to_inject.
+        merged = {}
+        for parameters in parameters_to_inject:
+            merged.update(parameters)
+        resolved_parameters = tuple(
+            (k, annotation.bean_contract, annotation.bean_name)
+            for k, annotation
+            in merged.items()
+        )
+    return len(_type_introspectors), sig, parameters_to_inject, resolved_parameters
+
+
+def _get_method_injection_plan(function) -> _InjectionPlanT:
+    """
+    :param function: The function underlying a bound method.
+    :return: The injection plan for methods bound to ``function``, i.e. excluding its first parameter.
+    """
+    plan = _bound_method_injection_plan_cache.get(function)
+    if plan is None or plan[0] != len(_type_introspectors):
+        sig = inspect.signature(function)
+        parameters = tuple(sig.parameters.values())
+        # Like inspect.signature does for bound methods, only drop the first parameter if it can receive the instance
+        # positionally on its own.
+        if len(parameters) > 0 and parameters[0].kind in (inspect.Parameter.POSITIONAL_ONLY,
+                                                           inspect.Parameter.POSITIONAL_OR_KEYWORD):
+            sig = sig.replace(parameters=parameters[1:])
+        plan = _build_injection_plan(function, sig)
+        _bound_method_injection_plan_cache[function] = plan
+    return plan
+
+
+def _get_injection_plan(func) -> _InjectionPlanT:
+    # Factories are injected on every transient resolution, and inspecting their signatures is comparatively expensive.
+    # The injected callable itself can't be cached, because it captures the beans that were resolved for it.
+    if inspect.ismethod(func) and inspect.isfunction(func.__func__):
+        return _get_method_injection_plan(func.__func__)
+    try:
+        plan = _injection_plan_cache.get(func)
+    except TypeError:
+        # The callable can't be weakly referenced or hashed.
+        return _build_injection_plan(func, inspect.signature(func))
+    if plan is None or plan[0] != len(_type_introspectors):
+        plan = _build_injection_plan(func, inspect.signature(func))
+        _injection_plan_cache[func] = plan
+    return plan
+
+
+def get_kwargs_to_inject(container, func):
+    _, sig, parameters_to_inject, resolved_parameters = _get_injection_plan(func)
+    if resolved_parameters is not None:
+        resolve_bean = container.resolve_bean
+        return {
+            k: resolve_bean(contract, bean_name)
+            for k, contract, bean_name
+            in resolved_parameters
+        }
+    to_inject = {}
+    for type_introspector, parameters in zip(_type_introspectors, parameters_to_inject):
+        if parameters is None:
+            to_inject.update(type_introspector.get_kwargs_to_inject(func=func, signature=sig, container=container))
+            continue
+        for k, annotation in parameters.items():
+            to_inject[k] = container.resolve_bean(contract=annotation.bean_contract, bean_name=annotation.bean_name)
     return to_inject
 
 
@@ -15,7 +15,7 @@
 import typing
 import uuid
 from typing import Any, Optional, Callable, Tuple, TypeVar, Type, Union, overload
-from weakref import WeakKeyDictionary, WeakValueDictionary
+from weakref import WeakValueDictionary
 
 from grundzeug.container.exceptions import ResolutionFailedError
 from grundzeug.container.interface import ReturnMessage, ContinueMessage, NotFoundMessage, \
@@ -24,22 +24,40 @@ from grundzeug.container.interface import ReturnMessage, ContinueMessage, NotFou
     RegisterInstanceProtocol, RegisterFactoryProtocol, RegistrationKey, ContainerRegistration, \
     ContractT, RegisterTypeProtocol, Injector, BEAN_NOT_FOUND, BEAN_NOT_FOUND_TYPE
 from grundzeug.container.registrations import InstanceContainerRegistration, \
-    ContainerFactoryContainerRegistration
+    ContainerFactoryContainerRegistration, RegistrationTypes
 from grundzeug.util.docs import set_module
 
 BeanT = TypeVar("BeanT")
 
 
+class _PluginStorage(dict):
+    """
+    Maps plugins to their per-container storage. Plugin storage is queried for every container in the hierarchy on
+    every uncached resolution, so this is a plain dictionary (which, unlike ``WeakKeyDictionary``, doesn't have to
+    create weak references on lookup) that can still be weakly referenced. The plugins are kept alive by the root
+    container anyway.
+    """
+    __slots__ = ("__weakref__",)
+
+
 @set_module("grundzeug.container")
 class ContainerResolveIndexer(IContainerResolveIndexer):
     def __init__(self, func: Callable[[ContractT, str], BeanT]):
         self._func = func
+        self._getters: typing.Dict[ContractT, GetBeanProtocol] = {}
 
     def __getitem__(self, contract: ContractT) -> GetBeanProtocol:
-        def __getbean(bean_name: Optional[str] = None):
-            return self._func(contract, bean_name)
+        # The getters don't hold any state apart from the contract, so they can be reused for repeated lookups.
+        getter = self._getters.get(contract)
+        if getter is None:
+            func = self._func
+
+            def __getbean(bean_name: Optional[str] = None):
+                return func(contract, bean_name)
 
-        return __getbean
+            getter = __getbean
+            self._getters[contract] = getter
+        return getter
 
 
 @set_module("grundzeug.container")
@@ -189,11 +207,11 @@ class ContainerInjector(Injector):
         self.__container = container
 
     def inject(self, func: FuncT) -> FuncT:
-        from grundzeug.container.di import inject
+        from grundzeug.container.di.injection import inject
         return inject(self.__container, func)
 
     def get_kwargs_to_inject(self, func: FuncT) -> typing.Dict[str, Any]:
-        from grundzeug.container.di import get_kwargs_to_inject
+        from grundzeug.container.di.injection import get_kwargs_to_inject
         return get_kwargs_to_inject(self.__container, func)
 
 
@@ -201,11 +219,15 @@ class ContainerInjector(Injector):
 class Container(IContainer):
     def __init__(self, parent: Optional["Container"] = None):
         super().__init__()
-        self.__uuid = uuid.uuid4()
-        self.__children = WeakValueDictionary()
+        # Most containers never have their UUID queried or get any children, so both are created on demand.
+        self.__uuid = None
+        self.__children = None
         self.__cache = {}
 
         self._parent = parent
+        # The parent of a container never changes, so the chain of ancestors (nearest first) is computed once. It
+        # doesn't include the container itself, so that it doesn't form a reference cycle.
+        self._ancestors: Tuple["Container", ...] = () if parent is None else (parent,) + parent._ancestors
         if parent is not None:
             parent._register_child(self)
 
@@ -229,40 +251,68 @@ class Container(IContainer):
         else:
             self._plugins = []
 
-        self._plugin_storage = WeakKeyDictionary()
+        self._plugin_storage = _PluginStorage()
+        self._registration_version = 0
 
-    def __cache_delete(self, key):
-        if key in self.__cache:
-            del self.__cache[key]
+    def __cache_clear(self):
+        # A registration may affect the resolution of other contracts (e.g. a new configuration provider changes the
+        # values of configurables), and descendants resolve through their ancestors, so the caches of this container
+        # and all of its descendants have to be dropped.
+        self.__cache.clear()
+        if self.__children is not None:
+            for child in list(self.__children.values()):
+                child.__cache_clear()
 
     def __cache_put(self, key, value):
         self.__cache[key] = value
 
     @property
     def uuid(self):
+        if self.__uuid is None:
+            self.__uuid = uuid.uuid4()
         return self.__uuid
 
     @property
     def children(self) -> typing.List["IContainer"]:
+        if self.__children is None:
+            return []
         return list(self.__children.values())
 
     def _register_child(self, container: IContainer):
-        self.__children[container.uuid] = container
+        if self.__children is None:
+            self.__children = WeakValueDictionary()
+        # Keyed by id() rather than by the UUID so that registering a child doesn't force its UUID to be generated. The
+        # weak dictionary drops the entry once the child dies, so a reused id() can't collide with a live child.
+        self.__children[id(container)] = container
 
     def add_plugin(self, plugin: ContainerResolutionPlugin) -> IContainer:
         if self._parent is not None:
-            self._parent.add_plugin(plugin)
+            self._ancestors[-1].add_plugin(plugin)
         else:
             self._plugins.insert(0, plugin)
+            self.__cache_clear()
         return self
 
     @property
     def plugins(self):
         if self._parent is not None:
-            return self._parent.plugins
+            return self._ancestors[-1]._plugins
         else:
             return self._plugins
 
+    @property
+    def registration_version(self) -> int:
+        if self._parent is not None:
+            return self._ancestors[-1]._registration_version
+        else:
+            return self._registration_version
+
+    def _increment_registration_version(self):
+        if self._parent is not None:
+            self._ancestors[-1]._registration_version += 1
+        else:
+            self._registration_version += 1
+
     @property
     def parent(self):
         return self._parent
@@ -278,7 +328,8 @@ class Container(IContainer):
                     registration=registration,
                     container=self
             ):
-                self.__cache_delete(key=key)
+                self.__cache_clear()
+                self._increment_registration_version()
                 return
 
     def _register_instance(
@@ -315,6 +366,8 @@ class Container(IContainer):
 
         if registration_type is None:
             registration_type = ContainerFactoryContainerRegistration
+        elif isinstance(registration_type, RegistrationTypes):
+            registration_type = registration_type.value
 
         registration = registration_type(
             container=self,
@@ -359,44 +412,48 @@ class Container(IContainer):
         if bean_name is None and contract == Container:
             return self
 
-        key = RegistrationKey(contract, bean_name)
+        # The resolver cache is keyed by plain tuples: hashing and comparing them doesn't involve any Python-level
+        # calls, so a cache hit doesn't have to construct a RegistrationKey at all.
+        cache_key = (contract, bean_name)
+        resolver = self.__cache.get(cache_key)
+        if resolver is not None:
+            return resolver.get()
 
-        if key in self.__cache:
-            return self.__cache[key].get()
+        key = RegistrationKey(contract, bean_name)
 
-        plugins = list(self.plugins)
+        # The plugin list lives in the root container, so fetch it once instead of walking up to the root for every
+        # ancestor container.
+        plugins = tuple(self.plugins)
         states = [
             plugin.resolve_bean_create_initial_state(key, self)
             for plugin
             in plugins
         ]
 
-        current_container = self
-        while current_container is not None:
-            for i, plugin in enumerate(self.plugins):
+        for current_container in (self, *self._ancestors):
+            for i, plugin in enumerate(plugins):
                 res = plugin.resolve_bean_reduce(key, states[i], self, current_container)
 
-                if isinstance(res, ReturnMessage):
+                # Most plugins don't handle most contracts, so NotFoundMessage is checked first.
+                if isinstance(res, NotFoundMessage):
+                    states[i] = res.state
+                elif isinstance(res, ReturnMessage):
                     resolver = res.resolver
                     if resolver.is_cacheable:
-                        self.__cache_put(key, resolver)
+                        self.__cache_put(cache_key, resolver)
                     return resolver.get()
-                elif isinstance(res, NotFoundMessage):
-                    states[i] = res.state
                 elif isinstance(res, ContinueMessage):
                     states[i] = res.state
                     break
                 else:
                     raise NotImplementedError()
 
-            current_container = current_container.parent
-
-        for i, plugin in enumerate(self.plugins):
+        for i, plugin in enumerate(plugins):
             res = plugin.resolve_bean_postprocess(key, states[i], self)
             if isinstance(res, ReturnMessage):
                 resolver = res.resolver
                 if resolver.is_cacheable:
-                    self.__cache_put(key, resolver)
+                    self.__cache_put(cache_key, resolver)
                 return resolver.get()
             elif isinstance(res, NotFoundMessage):
                 pass
@@ -423,17 +480,21 @@ class Container(IContainer):
         return self._try_resolve_indexer
 
     def inject(self, func: FuncT) -> FuncT:
-        from grundzeug.container.di import inject
+        # Factories are injected on every transient resolution. Importing from the module rather than from the package
+        # avoids the package's fromlist handling, which runs in Python on every call.
+        from grundzeug.container.di.injection import inject
         return inject(self, func)
 
     def get_kwargs_to_inject(self, func: FuncT) -> typing.Dict[str, Any]:
-        from grundzeug.container.di import get_kwargs_to_inject
+        from grundzeug.container.di.injection import get_kwargs_to_inject
         return get_kwargs_to_inject(self, func)
 
     def get_plugin_storage(self, plugin: ContainerResolutionPlugin):
-        if plugin not in self._plugin_storage:
-            self._plugin_storage[plugin] = {}
-        return self._plugin_storage[plugin]
+        storage = self._plugin_storage.get(plugin)
+        if storage is None:
+            storage = {}
+            self._plugin_storage[plugin] = storage
+        return storage
 
 
 __all__ = ["ContainerResolveIndexer", "ContainerRegisterInstanceIndexer", "ContainerRegisterFactoryIndexer",
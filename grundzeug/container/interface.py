@@ -41,9 +41,25 @@ class RegistrationKey:
     bean_contract: ContractT
     bean_name: Optional[str]
 
+    def __hash__(self):
+        # Registration keys are looked up in the resolver cache and the plugin registries on every resolution, and
+        # hashing a generic contract goes through the Python-level _GenericAlias.__hash__, so the hash is only computed
+        # once per key. The memo lives in the instance dictionary rather than in a dataclass field, so that it doesn't
+        # show up in fields(), asdict() or astuple().
+        h = self.__dict__.get("_hash")
+        if h is None:
+            h = hash((self.bean_contract, self.bean_name))
+            object.__setattr__(self, "_hash", h)
+        return h
+
+    def __reduce__(self):
+        # Hashes of strings differ between interpreter runs, so the memo must not be carried over by pickle or copy.
+        return RegistrationKey, (self.bean_contract, self.bean_name)
+
 
 @set_module("grundzeug.container")
 class ContainerRegistration(ABC):
+    __slots__ = ("container", "key")
 
     def __init__(
             self,
@@ -72,6 +88,14 @@ class ContainerRegistration(ABC):
         """
         raise NotImplementedError()
 
+    @property
+    def is_idempotent(self) -> bool:
+        """
+        :return: ``True`` if calling this registration repeatedly with the same container always yields the same bean \
+                 instance, ``False`` otherwise.
+        """
+        return False
+
 
 @set_module("grundzeug.container")
 class GetBeanProtocol(typing_extensions.Protocol):
@@ -414,6 +438,7 @@ class BeanResolver(ABC):
     Returned by container resolution plugins during bean resolution. The purpose of bean resolvers is to provide a
     reusable mechanism for retrieving beans from containers without querying the plugins on subsequent resolutions.
     """
+    __slots__ = ()
 
     @abstractmethod
     def get(self):
@@ -431,6 +456,14 @@ class BeanResolver(ABC):
         """
         raise NotImplementedError()
 
+    @property
+    def is_idempotent(self) -> bool:
+        """
+        :return: ``True`` if :py:meth:`~grundzeug.container.BeanResolver.get` always returns the same bean instance, \
+                 ``False`` otherwise.
+        """
+        return False
+
 
 @set_module("grundzeug.container")
 @dataclass(frozen=True)
@@ -693,6 +726,15 @@ class IContainer(Injector):
         """
         raise NotImplementedError()
 
+    @property
+    @abstractmethod
+    def registration_version(self) -> int:
+        """
+        :return: A counter that changes each time a bean is registered with any container in this container \
+                 hierarchy. Plugins may use it to detect that the results they have cached may be stale.
+        """
+        raise NotImplementedError()
+
     @property
     @abstractmethod
     def parent(self) -> Optional["IContainer"]:
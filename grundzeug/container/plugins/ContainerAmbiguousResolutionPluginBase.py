@@ -140,7 +140,8 @@ class ContainerAmbiguousResolutionPluginBase(ContainerResolutionPlugin, ABC):
             container: IContainer
     ) -> typing.Iterable[typing.Tuple[RegistrationKey, ContainerRegistration]]:
         registry = container.get_plugin_storage(self)
-        return registry.items()
+        # Return a snapshot so that callers may register beans while iterating over the registrations.
+        return tuple(registry.items())
 
 
 __all__ = ["ContainerAmbiguousResolutionPluginBase"]
@@ -21,20 +21,41 @@ from grundzeug.container.plugins.common import RegistrationBeanResolver
 T = TypeVar("T")
 
 
-class BeanList(Generic[T], tuple, typing.Iterable[T], typing.Sized):
+class BeanList(tuple, Generic[T]):
     pass
 
 
+_EMPTY_BEAN_LIST = BeanList()
+
+
 class _MultiBeanResolver(BeanResolver):
+    __slots__ = ("resolvers", "_getters", "_is_cacheable", "_is_idempotent", "_beans")
+
     def __init__(self, resolvers: typing.List[BeanResolver]):
         self.resolvers = resolvers
+        self._getters = tuple(resolver.get for resolver in resolvers)
+        # The resolvers never change after construction, so the caching policy can be computed once.
+        self._is_cacheable = all(x.is_cacheable for x in resolvers)
+        self._is_idempotent = all(x.is_idempotent for x in resolvers)
+        # BeanLists are immutable, so all resolvers without any beans can share the same empty BeanList.
+        self._beans = _EMPTY_BEAN_LIST if len(resolvers) == 0 else None
 
     def get(self):
-        return BeanList((resolver.get() for resolver in self.resolvers))
+        if self._beans is not None:
+            return self._beans
+        beans = BeanList([getter() for getter in self._getters])
+        if self._is_idempotent:
+            # The beans won't change, so the same BeanList can be returned for all subsequent resolutions.
+            self._beans = beans
+        return beans
 
     @property
     def is_cacheable(self) -> bool:
-        return all(x.is_cacheable for x in self.resolvers)
+        return self._is_cacheable
+
+    @property
+    def is_idempotent(self) -> bool:
+        return self._is_idempotent
 
 
 class ContainerBeanListResolutionPlugin(ContainerResolutionPlugin):
@@ -58,7 +79,7 @@ class ContainerBeanListResolutionPlugin(ContainerResolutionPlugin):
     """
 
     def applies_to(self, bean_contract: ContractT):
-        return getattr(bean_contract, "__origin__", None) == BeanList
+        return getattr(bean_contract, "__origin__", None) is BeanList
 
     def register(
             self,
@@ -70,12 +91,7 @@ class ContainerBeanListResolutionPlugin(ContainerResolutionPlugin):
             return False
 
         registry = container.get_plugin_storage(self)
-
-        registration_list = registry.get(key, None)
-        if registration_list is None:
-            registration_list = []
-            registry[key] = registration_list
-        registration_list.append(registration)
+        registry.setdefault(key, []).append(registration)
         return True
 
     def resolve_bean_create_initial_state(
@@ -98,15 +114,16 @@ class ContainerBeanListResolutionPlugin(ContainerResolutionPlugin):
         bean_resolvers: typing.List[RegistrationBeanResolver] = local_state
 
         registry = ancestor_container.get_plugin_storage(self)
-        registrations = registry[key]
-
-        if key in registry:
-            bean_resolvers = bean_resolvers + \
-                             [
-                                 RegistrationBeanResolver(registration=registration, container=container)
-                                 for registration
-                                 in registrations
-                             ]
+        registrations = registry.get(key)
+        if registrations is None:
+            return ContinueMessage(bean_resolvers)
+
+        # The state is local to the current resolution, so it's safe to extend it in place.
+        bean_resolvers.extend(
+            RegistrationBeanResolver(registration=registration, container=container)
+            for registration
+            in registrations
+        )
         return ContinueMessage(bean_resolvers)
 
     def resolve_bean_postprocess(
@@ -126,9 +143,14 @@ class ContainerBeanListResolutionPlugin(ContainerResolutionPlugin):
             container: IContainer
     ) -> typing.Iterable[typing.Tuple[RegistrationKey, ContainerRegistration]]:
         registry = container.get_plugin_storage(self)
-        for registration_key, registrations in registry.items():
-            for registration in registrations:
-                yield registration_key, registration
+        # Return a snapshot so that callers may register beans while iterating over the registrations.
+        return tuple(
+            (registration_key, registration)
+            for registration_key, registrations
+            in registry.items()
+            for registration
+            in registrations
+        )
 
 
 __all__ = ["BeanList", "ContainerBeanListResolutionPlugin"]
@@ -14,7 +14,8 @@
 
 import typing
 from dataclasses import dataclass
-from typing import Any, Union, TypeVar, Set, Tuple, Dict, Generator
+from typing import Any, Union, TypeVar, Set, Tuple, Dict, FrozenSet, Generator, Callable, _GenericAlias
+from weakref import WeakKeyDictionary
 
 from grundzeug.config import CanonicalConfigPathT, MissingConfigurationKeysException, \
     is_configuration_class
@@ -25,14 +26,53 @@ from grundzeug.container.interface import ReturnMessage, ContinueMessage, NotFou
 from grundzeug.container.plugins import BeanList
 from grundzeug.container.plugins.common import ValueBeanResolver
 from grundzeug.converters.common import Converter
+from grundzeug.util.sentinels import make_sentinel
 
 T = TypeVar("T")
 
+# typing caches subscripted generics, so this is the same alias that users register their providers with.
+_CONFIGURATION_PROVIDER_LIST = BeanList[ConfigurationProvider]
+
+# The key under which each container's plugin storage keeps the chain of provider registrations visible from it.
+_, _PROVIDER_CHAIN_KEY = make_sentinel()
+_, _PROVIDER_NOT_CREATED = make_sentinel()
+
 
 @dataclass
 class _ConfigurationValueCollectionState:
     values_left_to_collect: Set[CanonicalConfigPathT]
     collected_values: Dict[CanonicalConfigPathT, str]
+    providers_queried: bool = False
+
+
+@dataclass
+class _ConfigurationProviderSlot:
+    registration: ContainerRegistration
+    provider: Any = _PROVIDER_NOT_CREATED
+    """
+    The provider obtained from ``registration``, kept if the registration is idempotent.
+    """
+
+
+@dataclass(frozen=True)
+class _ConfigurationField:
+    attr_path: Tuple[str, ...]
+    """
+    The attribute names leading from the root configuration class instance to this field.
+    """
+    owner_attr_path: Tuple[str, ...]
+    """
+    ``attr_path`` without the name of this field, i.e. the path to the instance that holds this field.
+    """
+    attr_name: str
+    full_path: CanonicalConfigPathT
+    configurable: Configurable
+    owner_class: type
+    """
+    The configuration class that declares this field.
+    """
+    is_configuration_class: bool
+    default: Any
 
 
 class ContainerConfigurationResolutionPlugin(ContainerResolutionPlugin):
@@ -40,11 +80,24 @@ class ContainerConfigurationResolutionPlugin(ContainerResolutionPlugin):
     Resolves Grundzeug configuration classes and configurables.
     """
 
+    def __init__(self):
+        self._linearized_fields_cache: Dict[type, Tuple[_ConfigurationField, ...]] = {}
+        self._paths_to_collect_cache: Dict[type, FrozenSet[CanonicalConfigPathT]] = {}
+        self._required_paths_cache: Dict[type, FrozenSet[CanonicalConfigPathT]] = {}
+        self._converter_cache: typing.MutableMapping[
+            IContainer,
+            Tuple[int, Dict[Tuple[type, Any], Callable[[Any], Any]]]
+        ] = WeakKeyDictionary()
+
     def applies_to(self, key: RegistrationKey):
         if key.bean_name is not None:
             return False
-        return hasattr(key.bean_contract, "__grundzeug_configuration__") \
-               or isinstance(key.bean_contract, Configurable)
+        contract = key.bean_contract
+        if isinstance(contract, _GenericAlias):
+            # Generic aliases don't forward dunder attributes to their origin, so they are never configuration classes.
+            # Checking this first skips the Python-level _GenericAlias.__getattr__ that hasattr would go through.
+            return False
+        return hasattr(contract, "__grundzeug_configuration__") or isinstance(contract, Configurable)
 
     def register(
             self,
@@ -52,22 +105,19 @@ class ContainerConfigurationResolutionPlugin(ContainerResolutionPlugin):
             registration: ContainerRegistration,
             container: IContainer
     ) -> bool:
-        if key.bean_contract == BeanList[ConfigurationProvider]:
+        bean_contract = key.bean_contract
+        if bean_contract is _CONFIGURATION_PROVIDER_LIST or bean_contract == _CONFIGURATION_PROVIDER_LIST:
             registry = container.get_plugin_storage(self)
-            if ConfigurationProvider not in registry:
-                registry[ConfigurationProvider] = []
-            registry[ConfigurationProvider].append(registration)
+            registry.setdefault(ConfigurationProvider, []).append(registration)
             return True
         return False
 
     def _iterate_configuration_class_fields(
             self,
             configuration_clazz: type
-    ) -> Generator[Tuple[str, Configurable], None, None]:
-        for k, v in configuration_clazz.__dict__.items():
-            if not isinstance(v, Configurable):
-                continue
-            yield k, v
+    ) -> Tuple[Tuple[str, Configurable], ...]:
+        # @configuration collects the fields (including the inherited ones) when it decorates the class.
+        return configuration_clazz.__grundzeug_configuration__.fields
 
     def _collect_values_create_initial_state(
             self,
@@ -87,51 +137,126 @@ class ContainerConfigurationResolutionPlugin(ContainerResolutionPlugin):
             return None
 
         if is_configuration_class(key.bean_contract):
-            paths_to_collect = self.get_paths_to_collect(key.bean_contract)
+            paths_to_collect = set(self.get_paths_to_collect(key.bean_contract))
             return self._collect_values_create_initial_state(paths_to_collect)
         else:
             configurable: Configurable = key.bean_contract
             return self._collect_values_create_initial_state({configurable.configurable_metadata.full_path})
 
-    def get_paths_to_collect(self, clazz):
-        cur_class_paths = {
-            c.configurable_metadata.full_path
-            for k, c
-            in self._iterate_configuration_class_fields(clazz)
-            if not is_configuration_class(c.configurable_metadata.clazz)
-        }
-        # Add paths from all child configuration classes
-        all_paths = cur_class_paths.union(*(
-            self.get_paths_to_collect(c.configurable_metadata.clazz)
-            for k, c
-            in self._iterate_configuration_class_fields(clazz)
-            if is_configuration_class(c.configurable_metadata.clazz)
-        ))
-        return all_paths
-
-    def _collect_values_reduce(
+    def _linearize_configuration_class(self, clazz: type) -> Tuple[_ConfigurationField, ...]:
+        """
+        Flattens the tree of configuration classes rooted at ``clazz`` into a tuple of fields. Fields of nested
+        configuration classes precede the field that holds the nested configuration class.
+        """
+        fields = self._linearized_fields_cache.get(clazz)
+        if fields is None:
+            fields = tuple(self._iterate_linearized_fields(clazz, ()))
+            self._linearized_fields_cache[clazz] = fields
+        return fields
+
+    def _iterate_linearized_fields(
+            self,
+            clazz: type,
+            attr_prefix: Tuple[str, ...]
+    ) -> Generator[_ConfigurationField, None, None]:
+        for k, c in self._iterate_configuration_class_fields(clazz):
+            attr_path = attr_prefix + (k,)
+            field_is_configuration_class = is_configuration_class(c.configurable_metadata.clazz)
+            if field_is_configuration_class:
+                yield from self._iterate_linearized_fields(c.configurable_metadata.clazz, attr_path)
+            yield _ConfigurationField(
+                attr_path=attr_path,
+                owner_attr_path=attr_prefix,
+                attr_name=k,
+                full_path=c.configurable_metadata.full_path,
+                configurable=c,
+                owner_class=clazz,
+                is_configuration_class=field_is_configuration_class,
+                default=c.configurable_metadata.default
+            )
+
+    def get_paths_to_collect(self, clazz) -> FrozenSet[CanonicalConfigPathT]:
+        paths = self._paths_to_collect_cache.get(clazz)
+        if paths is None:
+            paths = frozenset(
+                field.full_path
+                for field
+                in self._linearize_configuration_class(clazz)
+                if not field.is_configuration_class
+            )
+            self._paths_to_collect_cache[clazz] = paths
+        return paths
+
+    def get_required_paths(self, clazz) -> FrozenSet[CanonicalConfigPathT]:
+        """
+        :param clazz: The configuration class.
+        :return: The full paths of the fields of ``clazz`` (including the fields of nested configuration classes) \
+                 which don't have a default value.
+        """
+        paths = self._required_paths_cache.get(clazz)
+        if paths is None:
+            paths = frozenset(
+                field.full_path
+                for field
+                in self._linearize_configuration_class(clazz)
+                if not field.is_configuration_class and field.default is MISSING
+            )
+            self._required_paths_cache[clazz] = paths
+        return paths
+
+    def _collect_values(
             self,
             state: _ConfigurationValueCollectionState,
-            container: IContainer,
-            ancestor_container: IContainer
+            container: IContainer
     ) -> _ConfigurationValueCollectionState:
-        if len(state.values_left_to_collect) == 0:
-            return state
-        registry = ancestor_container.get_plugin_storage(self)
-        if ConfigurationProvider not in registry:
-            return state
-        for provider_registration in reversed(registry[ConfigurationProvider]):
-            provider_registration: ContainerRegistration = provider_registration
-            config_provider: ConfigurationProvider = provider_registration(container)
-            to_remove = []
-            for to_collect in state.values_left_to_collect:
+        for slot in self._get_provider_chain(container):
+            if len(state.values_left_to_collect) == 0:
+                # Everything has been collected, so there's no need to instantiate the remaining providers.
+                break
+            config_provider: ConfigurationProvider = slot.provider
+            if config_provider is _PROVIDER_NOT_CREATED:
+                config_provider = slot.registration(container)
+                if slot.registration.is_idempotent:
+                    slot.provider = config_provider
+            available_keys = config_provider.available_keys()
+            if available_keys is None:
+                candidates = state.values_left_to_collect
+            else:
+                candidates = state.values_left_to_collect & available_keys
+            collected_now = set()
+            for to_collect in candidates:
                 res = config_provider.get_value(to_collect)
-                if res != MISSING:
-                    to_remove.append(to_collect)
+                if res is not MISSING:
+                    collected_now.add(to_collect)
                     state.collected_values[to_collect] = res
-            state.values_left_to_collect.difference_update(to_remove)
+            state.values_left_to_collect -= collected_now
         return state
 
+    def _get_provider_chain(self, container: IContainer) -> Tuple[_ConfigurationProviderSlot, ...]:
+        """
+        Returns the provider registrations of ``container`` and its ancestors in the order in which they should be
+        queried. The chain is kept in the storage of ``container`` until a new bean is registered somewhere in the
+        container hierarchy.
+        """
+        storage = container.get_plugin_storage(self)
+        registration_version = container.registration_version
+        version_and_chain = storage.get(_PROVIDER_CHAIN_KEY)
+        if version_and_chain is None or version_and_chain[0] != registration_version:
+            slots = []
+            current_container = container
+            while current_container is not None:
+                provider_registrations = current_container.get_plugin_storage(self).get(ConfigurationProvider)
+                if provider_registrations is not None:
+                    slots.extend(
+                        _ConfigurationProviderSlot(registration)
+                        for registration
+                        in reversed(provider_registrations)
+                    )
+                current_container = current_container.parent
+            version_and_chain = (registration_version, tuple(slots))
+            storage[_PROVIDER_CHAIN_KEY] = version_and_chain
+        return version_and_chain[1]
+
     def resolve_bean_reduce(
             self,
             key: RegistrationKey,
@@ -143,14 +268,17 @@ class ContainerConfigurationResolutionPlugin(ContainerResolutionPlugin):
             return NotFoundMessage(local_state)
 
         local_state: _ConfigurationValueCollectionState = local_state
-        local_state = self._collect_values_reduce(local_state, container, ancestor_container)
+        if not local_state.providers_queried:
+            # The providers of all ancestors are queried at once, using the chain cached for this container.
+            local_state = self._collect_values(local_state, container)
+            local_state.providers_queried = True
         if len(local_state.values_left_to_collect) == 0:
             if is_configuration_class(key.bean_contract):
                 bean = self._construct_configuration_class(key.bean_contract, local_state, container)
                 return ReturnMessage(ValueBeanResolver(bean))
             else:
                 configurable: Configurable = key.bean_contract
-                value = local_state.collected_values[tuple(configurable.configurable_metadata.full_path)]
+                value = local_state.collected_values[configurable.configurable_metadata.full_path]
                 value = self._transform_value(value, configurable, container)
                 configurable.validate(value, container)
                 return ReturnMessage(ValueBeanResolver(value))
@@ -166,12 +294,11 @@ class ContainerConfigurationResolutionPlugin(ContainerResolutionPlugin):
             return NotFoundMessage(None)
 
         if is_configuration_class(key.bean_contract):
-            self._assert_no_missing_configuration_keys(key, local_state)
             bean = self._construct_configuration_class(key.bean_contract, local_state, container)
             return ReturnMessage(ValueBeanResolver(bean))
         else:
             configurable: Configurable = key.bean_contract
-            if configurable.configurable_metadata.default == MISSING:
+            if configurable.configurable_metadata.default is MISSING:
                 raise MissingConfigurationKeysException(
                     local_state.values_left_to_collect,
                     f"Could not resolve property {configurable.configurable_metadata.field_path} because there's no "
@@ -186,68 +313,79 @@ class ContainerConfigurationResolutionPlugin(ContainerResolutionPlugin):
             local_state: _ConfigurationValueCollectionState,
             container: IContainer
     ) -> Any:
-        bean = clazz()
-        for k, c in self._iterate_configuration_class_fields(clazz):
-            full_path = tuple(c.configurable_metadata.full_path)
-            if is_configuration_class(c.configurable_metadata.clazz):
-                value = self._construct_configuration_class(c.configurable_metadata.clazz, local_state, container)
-            elif full_path in local_state.collected_values:
-                value = local_state.collected_values[full_path]
-                value = self._transform_value(value, c, container)
-            elif c.configurable_metadata.default != MISSING:
-                value = c.configurable_metadata.default
+        # Every path that hasn't been collected by now is missing, so the check doesn't need to look at the fields.
+        missing_values = self.get_required_paths(clazz) & local_state.values_left_to_collect
+        if len(missing_values) != 0:
+            raise MissingConfigurationKeysException(
+                set(missing_values),
+                f"Could not resolve configuration class {clazz}: the following configuration keys "
+                f"are missing: {', '.join((str(x) for x in missing_values))}."
+            )
+
+        beans = {(): clazz()}
+        collected_values = local_state.collected_values
+        # The converter cache is looked up once for the whole class instead of once per field.
+        converters = self._get_converters(container)
+        for field in self._linearize_configuration_class(clazz):
+            c = field.configurable
+            if field.is_configuration_class:
+                value = beans.get(field.attr_path)
+                if value is None:
+                    value = c.configurable_metadata.clazz()
             else:
-                raise Exception("Impossible situation: this case should've been handled by the "
-                                "len(missing_values) != 0 check above!")
+                value = collected_values.get(field.full_path, MISSING)
+                if value is MISSING:
+                    value = field.default
+                else:
+                    value = self._transform_value(value, c, container, converters)
             c.validate(value, container)
 
-            setattr(bean, k, value)
-        return bean
+            owner = beans.get(field.owner_attr_path)
+            if owner is None:
+                owner = field.owner_class()
+                beans[field.owner_attr_path] = owner
+            setattr(owner, field.attr_name, value)
+        return beans[()]
 
-    def _transform_value(self, value, configurable: Configurable, container: IContainer):
-        converter = container.try_resolve[Converter[type(value), configurable.configurable_metadata.clazz]]()
-        if converter is BEAN_NOT_FOUND:
-            converter = Converter[type(value), configurable.configurable_metadata.clazz].identity()
+    def _transform_value(
+            self,
+            value,
+            configurable: Configurable,
+            container: IContainer,
+            converters: typing.Optional[Dict[Tuple[type, Any], Callable[[Any], Any]]] = None
+    ):
+        if converters is None:
+            converters = self._get_converters(container)
+        type_from = type(value)
+        type_to = configurable.configurable_metadata.clazz
+        converter = converters.get((type_from, type_to))
+        if converter is None:
+            converter = container.try_resolve[Converter[type_from, type_to]]()
+            if converter is BEAN_NOT_FOUND:
+                converter = Converter[type_from, type_to].identity()
+            converters[(type_from, type_to)] = converter
         return converter(value)
 
-    def _get_paths_of_configurables_with_defaults(self, clazz):
-        cur_class_paths = {
-            c.configurable_metadata.full_path
-            for k, c
-            in self._iterate_configuration_class_fields(clazz)
-            if c.configurable_metadata.default != MISSING
-        }
-        # Add paths from all child configuration classes
-        all_paths = cur_class_paths.union(*(
-            self._get_paths_of_configurables_with_defaults(c.configurable_metadata.clazz)
-            for k, c
-            in self._iterate_configuration_class_fields(clazz)
-            if is_configuration_class(c.configurable_metadata.clazz)
-        ))
-        return all_paths
-
-    def _assert_no_missing_configuration_keys(
-            self,
-            key: RegistrationKey,
-            local_state: _ConfigurationValueCollectionState
-    ) -> None:
-        missing_values = local_state.values_left_to_collect \
-            .difference(self._get_paths_of_configurables_with_defaults(key.bean_contract))
-        if len(missing_values) != 0:
-            raise MissingConfigurationKeysException(
-                missing_values,
-                f"Could not resolve configuration class {key.bean_contract}: the following configuration keys "
-                f"are missing: {', '.join((str(x) for x in missing_values))}."
-            )
+    def _get_converters(self, container: IContainer) -> Dict[Tuple[type, Any], Callable[[Any], Any]]:
+        # Converters are cached per container until a new bean is registered somewhere in the container hierarchy.
+        registration_version = container.registration_version
+        version_and_converters = self._converter_cache.get(container)
+        if version_and_converters is None or version_and_converters[0] != registration_version:
+            version_and_converters = (registration_version, {})
+            self._converter_cache[container] = version_and_converters
+        return version_and_converters[1]
 
     def registrations(
             self,
             container: IContainer
     ) -> typing.Iterable[typing.Tuple[RegistrationKey, ContainerRegistration]]:
         registry = container.get_plugin_storage(self)
-        if ConfigurationProvider in registry:
-            for registration in registry[ConfigurationProvider]:
-                yield BeanList[ConfigurationProvider], registration
+        # Return a snapshot so that callers may register beans while iterating over the registrations.
+        return tuple(
+            (_CONFIGURATION_PROVIDER_LIST, registration)
+            for registration
+            in registry.get(ConfigurationProvider, ())
+        )
 
 
 __all__ = ["ContainerConfigurationResolutionPlugin"]
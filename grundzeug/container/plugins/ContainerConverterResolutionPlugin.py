@@ -42,10 +42,8 @@ class ContainerConverterResolutionPlugin(ContainerAmbiguousResolutionPluginBase)
             requested_key: RegistrationKey,
             registered_key: RegistrationKey
     ):
-        requested_converter: Converter = requested_key.bean_contract
-        registered_converter: Converter = registered_key.bean_contract
-        return can_substitute(requested_converter.generic_TFrom, registered_converter.generic_TFrom) \
-               and can_substitute(registered_converter.generic_TTo, requested_converter.generic_TTo)
+        # A registered converter is compatible iff the requested converter dominates it.
+        return self._dominates(requested_key.bean_contract, registered_key.bean_contract)
 
     def choose_best_candidate(
             self,
@@ -58,33 +56,31 @@ class ContainerConverterResolutionPlugin(ContainerAmbiguousResolutionPluginBase)
         # However, if we request a Converter[int, BaseClass] and the candidate list consists of
         # Converter[int, BaseClass] and Converter[int, DerivedClass], Converter[int, BaseClass] will be returned
         # because BaseClass is "closer" to the requested return type.
-        is_dominated = [False for _ in candidates]
-        for i, registration_key in enumerate(candidates):
-            if is_dominated[i]:
+        keys = list(candidates)
+        # Bit i is set iff the i-th candidate is dominated by some other candidate.
+        dominated = 0
+        for i, registration_key in enumerate(keys):
+            if dominated & (1 << i):
                 continue
-            for j, other_registration_key in enumerate(candidates):
-                if i == j or is_dominated[j]:
+            for j, other_registration_key in enumerate(keys):
+                if i == j or dominated & (1 << j):
                     continue
-                arg1 = registration_key.bean_contract.generic_TFrom
-                arg2 = other_registration_key.bean_contract.generic_TFrom
-                ret1 = registration_key.bean_contract.generic_TTo
-                ret2 = other_registration_key.bean_contract.generic_TTo
-                if can_substitute(arg1, arg2) \
-                        and can_substitute(ret2, ret1):
-                    is_dominated[j] = True
+                if self._dominates(registration_key.bean_contract, other_registration_key.bean_contract):
+                    dominated |= 1 << j
 
-        result = [
-            resolved
-            for resolved, is_dominated
-            in zip(candidates, is_dominated)
-            if not is_dominated
-        ]
-        if len(result) < 1:
+        not_dominated = ((1 << len(keys)) - 1) & ~dominated
+        if not_dominated == 0:
             return None
-        elif len(result) > 1:
+        elif not_dominated & (not_dominated - 1) != 0:
             raise Exception("Ambiguous resolution!")
         else:
-            return candidates[result[0]]
+            return candidates[keys[not_dominated.bit_length() - 1]]
+
+    def _dominates(self, converter: Converter, other_converter: Converter) -> bool:
+        # Not cached here: can_substitute memoizes its decisions itself, and unlike a per-pair cache, it forgets them when
+        # ABCMeta.register changes which classes can substitute an ABC.
+        return can_substitute(converter.generic_TFrom, other_converter.generic_TFrom) \
+            and can_substitute(other_converter.generic_TTo, converter.generic_TTo)
 
 
 __all__ = ["ContainerConverterResolutionPlugin"]
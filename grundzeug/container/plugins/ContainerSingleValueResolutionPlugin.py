@@ -54,8 +54,11 @@ class ContainerSingleValueResolutionPlugin(ContainerResolutionPlugin):
     ) -> Union[ReturnMessage, ContinueMessage, NotFoundMessage]:
         registry = ancestor_container.get_plugin_storage(self)
 
-        if key in registry:
-            registration = registry[key]
+        registration = registry.get(key)
+        if registration is not None:
+            # There's no need to share resolvers between resolutions: the resolving container caches this resolver, so
+            # it is only created when the container's cache misses. Keeping resolvers around per container elsewhere
+            # would also keep those containers alive, since resolvers reference them.
             return ReturnMessage(RegistrationBeanResolver(registration=registration, container=container))
         return NotFoundMessage(None)
 
@@ -72,7 +75,8 @@ class ContainerSingleValueResolutionPlugin(ContainerResolutionPlugin):
             container: IContainer
     ) -> typing.Iterable[typing.Tuple[RegistrationKey, ContainerRegistration]]:
         registry = container.get_plugin_storage(self)
-        return registry.items()
+        # Return a snapshot so that callers may register beans while iterating over the registrations.
+        return tuple(registry.items())
 
 
 __all__ = ["ContainerSingleValueResolutionPlugin"]
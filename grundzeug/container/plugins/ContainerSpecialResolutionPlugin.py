@@ -14,7 +14,6 @@
 import typing
 from typing import Any, Union
 
-from grundzeug.container import ContainerInjector
 from grundzeug.container.interface import ReturnMessage, ContinueMessage, NotFoundMessage, ContainerResolutionPlugin, \
     IContainer, RegistrationKey, ContainerRegistration, Injector
 from grundzeug.container.plugins.common import ValueBeanResolver
@@ -47,8 +46,16 @@ class ContainerSpecialResolutionPlugin(ContainerResolutionPlugin):
             container: IContainer,
             ancestor_container: IContainer
     ) -> Union[ReturnMessage, ContinueMessage, NotFoundMessage]:
-        if key.bean_name is None and key.bean_contract == Injector:
-            return ReturnMessage(ValueBeanResolver(ContainerInjector(container)))
+        if key.bean_name is None and key.bean_contract is Injector:
+            # The injector is kept in the container's own plugin storage rather than in a WeakKeyDictionary on the
+            # plugin, because the injector references its container and would otherwise keep it alive.
+            storage = container.get_plugin_storage(self)
+            resolver = storage.get(Injector)
+            if resolver is None:
+                from grundzeug.container.impl import ContainerInjector
+                resolver = ValueBeanResolver(ContainerInjector(container))
+                storage[Injector] = resolver
+            return ReturnMessage(resolver)
         return NotFoundMessage(None)
 
     def resolve_bean_postprocess(
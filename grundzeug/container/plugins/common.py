@@ -15,6 +15,8 @@ from grundzeug.container.interface import BeanResolver, ContainerRegistration, I
 
 
 class ValueBeanResolver(BeanResolver):
+    __slots__ = ("_is_cacheable", "value")
+
     def __init__(self, value, is_cacheable=True):
         """
         A resolver that always resolves a predetermined value.
@@ -32,8 +34,14 @@ class ValueBeanResolver(BeanResolver):
     def is_cacheable(self) -> bool:
         return self._is_cacheable
 
+    @property
+    def is_idempotent(self) -> bool:
+        return True
+
 
 class RegistrationBeanResolver(BeanResolver):
+    __slots__ = ("container", "_is_cacheable", "registration")
+
     def __init__(
             self,
             registration: ContainerRegistration,
@@ -59,5 +67,9 @@ class RegistrationBeanResolver(BeanResolver):
     def is_cacheable(self) -> bool:
         return self._is_cacheable
 
+    @property
+    def is_idempotent(self) -> bool:
+        return self.registration.is_idempotent
+
 
 __all__ = ["ValueBeanResolver", "RegistrationBeanResolver"]
@@ -13,16 +13,20 @@
 #  limitations under the License.
 
 from enum import Enum
-from typing import Any, Callable
-from weakref import WeakKeyDictionary
+from typing import Any, Callable, Dict
+from weakref import ref
 
 from grundzeug.container.interface import ContainerRegistration, RegistrationKey, IContainer
+from grundzeug.util.sentinels import make_sentinel
+
+_, _MISSING = make_sentinel()
 
 
 class InstanceContainerRegistration(ContainerRegistration):
     """
     Returns the same instance each time the bean is being resolved.
     """
+    __slots__ = ("instance",)
 
     def __init__(
             self,
@@ -33,6 +37,10 @@ class InstanceContainerRegistration(ContainerRegistration):
         super().__init__(container, key)
         self.instance = instance
 
+    @property
+    def is_idempotent(self) -> bool:
+        return True
+
     def __call__(self, container: IContainer) -> Any:
         return self.instance
 
@@ -42,6 +50,7 @@ class ContainerFactoryContainerRegistration(ContainerRegistration):
     Creates a new instance of the bean on the first attempt to resolve this bean. All subsequent resolutions for this
     container and its descendants will yield the same instance.
     """
+    __slots__ = ("factory", "_value")
 
     def __init__(
             self,
@@ -51,20 +60,26 @@ class ContainerFactoryContainerRegistration(ContainerRegistration):
     ):
         super().__init__(container, key)
         self.factory = factory
-        self._registered = False
-        self._value = None
+        self._value = _MISSING
+
+    @property
+    def is_idempotent(self) -> bool:
+        return True
 
     def __call__(self, container: IContainer) -> Any:
-        if not self._registered:
-            self._registered = True
-            self._value = self.container.inject(self.factory)()
-        return self._value
+        value = self._value
+        if value is _MISSING:
+            # The factory is only ever called once, even if it fails or tries to resolve this bean again.
+            self._value = None
+            value = self._value = self.container.inject(self.factory)()
+        return value
 
 
 class TransientFactoryContainerRegistration(ContainerRegistration):
     """
     Instantiates a new bean each time the bean is being resolved.
     """
+    __slots__ = ("factory",)
 
     def __init__(
             self,
@@ -85,6 +100,7 @@ class HierarchicalFactoryContainerRegistration(ContainerRegistration):
     the bean from different containers will yield different containers, while resolving the bean from a single container
     will always yield the same instance.
     """
+    __slots__ = ("factory", "_values", "_refs")
 
     def __init__(
             self,
@@ -94,12 +110,27 @@ class HierarchicalFactoryContainerRegistration(ContainerRegistration):
     ):
         super().__init__(container, key)
         self.factory = factory
-        self._values = WeakKeyDictionary()
+        # The values are keyed by container ids instead of being stored in a WeakKeyDictionary, because looking up a
+        # plain dictionary is much cheaper. The weak references remove the values once their containers are collected.
+        self._values: Dict[int, Any] = {}
+        self._refs: Dict[int, ref] = {}
+
+    @property
+    def is_idempotent(self) -> bool:
+        return True
+
+    def _forget(self, container_id: int):
+        self._values.pop(container_id, None)
+        self._refs.pop(container_id, None)
 
     def __call__(self, container: IContainer) -> Any:
-        if not container in self._values:
-            self._values[container] = container.inject(self.factory)()
-        return self._values[container]
+        container_id = id(container)
+        value = self._values.get(container_id, _MISSING)
+        if value is _MISSING:
+            value = container.inject(self.factory)()
+            self._values[container_id] = value
+            self._refs[container_id] = ref(container, lambda _, c=container_id: self._forget(c))
+        return value
 
 
 class RegistrationTypes(Enum):
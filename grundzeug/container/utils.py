@@ -11,10 +11,46 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import Type
+from typing import Type, Dict, Tuple
+from weakref import WeakKeyDictionary
 
 from grundzeug.container import IContainer, ContainerResolutionPlugin
 
+# Maps each container to the number of plugins it had when the cache was filled and the plugins found by type. Plugins
+# can only be added to a container, so a change in the number of plugins means that the cached lookups are stale.
+_plugin_cache: "WeakKeyDictionary[IContainer, Tuple[int, Dict[type, ContainerResolutionPlugin]]]" = WeakKeyDictionary()
+
+
+def _find_container_plugin_by_type(container: IContainer, plugin_type: Type[ContainerResolutionPlugin]):
+    return next(
+        plugin
+        for plugin
+        in container.plugins
+        if isinstance(plugin, plugin_type)
+    )
+
+
+def _index_container_plugins_by_type(plugins) -> Dict[type, ContainerResolutionPlugin]:
+    plugins_by_type = {}
+    for plugin in plugins:
+        for clazz in type(plugin).__mro__:
+            # The first matching plugin wins, just like in _find_container_plugin_by_type.
+            plugins_by_type.setdefault(clazz, plugin)
+    return plugins_by_type
+
+
+def _find_plugin_list_owner(container: IContainer, plugins) -> IContainer:
+    # Child containers share the plugin list of the root container, so they can share its index as well instead of
+    # building one for each (often short-lived) child.
+    root = container
+    parent = root.parent
+    while parent is not None:
+        root = parent
+        parent = root.parent
+    if root is not container and root.plugins is plugins:
+        return root
+    return container
+
 
 def lookup_container_plugin_by_type(container: IContainer, plugin_type: Type[ContainerResolutionPlugin]):
     """
@@ -24,12 +60,23 @@ def lookup_container_plugin_by_type(container: IContainer, plugin_type: Type[Con
     :param plugin_type: The type of the plugin to find.
     :return: The first instance of ``plugin_type`` in ``container.plugins``.
     """
-    return next(
-        plugin
-        for plugin
-        in container.plugins
-        if isinstance(plugin, plugin_type)
-    )
+    plugins = container.plugins
+    owner = _find_plugin_list_owner(container, plugins)
+    try:
+        cached = _plugin_cache.get(owner)
+    except TypeError:
+        # The container can't be weakly referenced, so there's nowhere to cache the lookup.
+        return _find_container_plugin_by_type(container, plugin_type)
+    if cached is None or cached[0] != len(plugins):
+        cached = (len(plugins), _index_container_plugins_by_type(plugins))
+        _plugin_cache[owner] = cached
+    plugins_by_type = cached[1]
+    plugin = plugins_by_type.get(plugin_type)
+    if plugin is None:
+        # Virtual subclasses (e.g. ones registered with ABCMeta.register) don't show up in the MRO.
+        plugin = _find_container_plugin_by_type(container, plugin_type)
+        plugins_by_type[plugin_type] = plugin
+    return plugin
 
 
 __all__ = ["lookup_container_plugin_by_type"]
@@ -19,6 +19,23 @@ from grundzeug.reflection.types import can_substitute
 TFrom = typing.TypeVar("TFrom")
 TTo = typing.TypeVar("TTo")
 
+_converter_cache_field = "__grundzeug_converters__"
+
+
+def _get_cached_converter(cls, name: str) -> typing.Optional["Converter"]:
+    converters = cls.__dict__.get(_converter_cache_field)
+    if converters is None:
+        return None
+    return converters.get(name)
+
+
+def _cache_converter(cls, name: str, converter: "Converter") -> "Converter":
+    # Building the converter classes is expensive, so the converters are stored on the generic alias they were built
+    # for, which lets them be collected along with the alias. Plain classes don't have a writable __dict__.
+    if isinstance(cls, typing._GenericAlias):
+        cls.__dict__.setdefault(_converter_cache_field, {})[name] = converter
+    return converter
+
 
 @generic_aware
 class Converter(typing.Generic[TFrom, TTo], ABC):
@@ -48,6 +65,10 @@ class Converter(typing.Generic[TFrom, TTo], ABC):
                             ``not can_substitute(type_from, type_to)``. See \
                             :py:func:`~grundzeug.reflection.types.can_substitute` for more details.
         """
+        converter = _get_cached_converter(cls, "identity")
+        if converter is not None:
+            return converter
+
         type_args = get_type_arguments(cls)
         type_from = type_args[TFrom]
         type_to = type_args[TTo]
@@ -62,7 +83,7 @@ class Converter(typing.Generic[TFrom, TTo], ABC):
             def __call__(self, value: TFrom) -> TTo:
                 return value
 
-        return _IdentityConverter()
+        return _cache_converter(cls, "identity", _IdentityConverter())
 
     @classmethod
     def cast(cls) -> "Converter[TFrom, TTo]":
@@ -71,6 +92,10 @@ class Converter(typing.Generic[TFrom, TTo], ABC):
                  mapped to ``str(x)``.
         :raises ValueError: If ``type_to`` is a :py:class:`~typing.TypeVar`.
         """
+        converter = _get_cached_converter(cls, "cast")
+        if converter is not None:
+            return converter
+
         type_args = get_type_arguments(cls)
 
         type_to = type_args[TTo]
@@ -82,7 +107,7 @@ class Converter(typing.Generic[TFrom, TTo], ABC):
             def __call__(self, value: TFrom) -> TTo:
                 return type_to(value)
 
-        return _CastConverter()
+        return _cache_converter(cls, "cast", _CastConverter())
 
 
 __all__ = ["Converter"]
@@ -24,8 +24,10 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import functools
+import types
 import typing
 from typing import TypeVar, Dict, Union, _GenericAlias, List
+from weakref import WeakKeyDictionary
 
 from grundzeug.util.collections import zip_equal
 from grundzeug.util.sentinels import make_sentinel
@@ -42,6 +44,9 @@ def _generic_aware_impl_wrap_classmethod(class_member, specialized_class, supple
 
 
 _extra_field_dict = "__grundzeug_extradict__"
+_, _missing_extra_field_sentinel = make_sentinel()
+_type_arguments_field = "__grundzeug_typeargs__"
+_unspecialized_type_arguments: "WeakKeyDictionary[type, Dict[TypeVar, TypeVar]]" = WeakKeyDictionary()
 
 
 # Pure evil: monkey-patch typing._GenericAlias to support class-specific attributes.
@@ -52,12 +57,14 @@ def _patch_generic_alias():
 
     @functools.wraps(orig_getattr)
     def wrapped___getattr__(cls, attr):
-        extra_dict = cls.__dict__.get(_extra_field_dict, {})
-        if attr in extra_dict:
-            v = extra_dict[attr]
-            if hasattr(v, "__get__"):
-                return v.__get__(None, cls)
-            return v
+        # typing looks up missing attributes on generic aliases all the time, so avoid allocating anything here.
+        extra_dict = cls.__dict__.get(_extra_field_dict)
+        if extra_dict is not None:
+            v = extra_dict.get(attr, _missing_extra_field_sentinel)
+            if v is not _missing_extra_field_sentinel:
+                if hasattr(v, "__get__"):
+                    return v.__get__(None, cls)
+                return v
         return orig_getattr(cls, attr)
 
     typing._GenericAlias.__getattr__ = wrapped___getattr__
@@ -66,8 +73,8 @@ def _patch_generic_alias():
 
     @functools.wraps(orig_getattr)
     def wrapped___setattr__(cls, attr, value):
-        extra_dict = cls.__dict__.get(_extra_field_dict, {})
-        if attr in extra_dict:
+        extra_dict = cls.__dict__.get(_extra_field_dict)
+        if extra_dict is not None and attr in extra_dict:
             v = extra_dict[attr]
             if hasattr(v, "__set__"):
                 v.__set__(None, value)
@@ -112,7 +119,10 @@ def _generic_aware_impl(cls: type, process_default_classmethod: bool = True):
     @functools.wraps(orig__class_getitem__)
     def __class_getitem__(cls):
         specialized_class = orig__class_getitem__(cls)
-        specialize_class(specialized_class, process_default_classmethod=process_default_classmethod)
+        # typing caches generic aliases, so the same alias is usually returned for the same type arguments. There's no
+        # need to walk the class members again if the alias has already been specialized.
+        if _extra_field_dict not in specialized_class.__dict__:
+            specialize_class(specialized_class, process_default_classmethod=process_default_classmethod)
         return specialized_class
 
     cls.__class_getitem__ = __class_getitem__
@@ -173,10 +183,17 @@ class generic_accessor():
         """
         self.type_var = type_var
         self.__class_override = _class_override
+        self.__value = _generic_class_override_sentinel
 
     def __get__(self, obj, klass=None):
-        klass = self._get_class(klass, obj)
-        return get_type_arguments(klass)[self.type_var]
+        # Accessors of specialized classes always resolve to the same type argument, so it is only looked up once.
+        value = self.__value
+        if value is not _generic_class_override_sentinel:
+            return value
+        value = get_type_arguments(self._get_class(klass, obj))[self.type_var]
+        if self.__class_override is not _generic_class_override_sentinel:
+            self.__value = value
+        return value
 
     def _get_class(self, klass, obj):
         if self.__class_override is _generic_class_override_sentinel:
@@ -198,12 +215,8 @@ class generic_classmethod(object):
     def __get__(self, obj, klass=None):
         if klass is None:
             klass = type(obj)
-
-        @functools.wraps(self.__func__)
-        def wrapper(*args):
-            return self.__func__(klass, *args)
-
-        return wrapper
+        # Binding a method is much cheaper than creating and decorating a wrapper function on every access.
+        return types.MethodType(self.__func__, klass)
 
 
 def get_type_parameters(cls: type) -> List[TypeVar]:
@@ -221,20 +234,29 @@ def get_type_arguments(cls: type) -> Dict[TypeVar, Union[TypeVar, typing.Any]]:
     """
     :param cls: a generic alias of a generic class.
     :return: a dictionary mapping the type parameters of the generic class to the type arguments specified in the \
-             generic alias.
+             generic alias. The dictionary is shared between calls and must not be modified.
     """
     if not isinstance(cls, _GenericAlias):
-        return {
-            type_var: type_var
-            for type_var
-            in get_type_parameters(cls)
+        type_arguments = _unspecialized_type_arguments.get(cls)
+        if type_arguments is None:
+            type_arguments = {
+                type_var: type_var
+                for type_var
+                in get_type_parameters(cls)
+            }
+            _unspecialized_type_arguments[cls] = type_arguments
+        return type_arguments
+
+    # The type arguments of a generic alias never change, so they are computed once and stored on the alias itself.
+    type_arguments = cls.__dict__.get(_type_arguments_field)
+    if type_arguments is None:
+        type_arguments = {
+            type_var: type_var_value
+            for type_var, type_var_value
+            in zip_equal(get_type_parameters(cls), getattr(cls, "__args__", ()))
         }
-
-    return {
-        type_var: type_var_value
-        for type_var, type_var_value
-        in zip_equal(get_type_parameters(cls), getattr(cls, "__args__", ()))
-    }
+        cls.__dict__[_type_arguments_field] = type_arguments
+    return type_arguments
 
 
 __all__ = ["generic_aware", "generic_accessor", "generic_classmethod", "get_type_arguments", "get_type_parameters"]
@@ -11,13 +11,21 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import abc
 import collections
 import inspect
 import typing
+# typing.get_origin and typing.get_args aren't available on Python 3.7. They also disagree with the raw attributes in
+# ways that matter here: get_args returns the parameters of a Callable as a nested list, and get_origin returns a value
+# for bare special forms like Generic. Since grundzeug.reflection.generics is built around _GenericAlias anyway, this
+# module inspects _GenericAlias.__origin__ and __args__ directly.
 from typing import _GenericAlias
+from weakref import WeakKeyDictionary
 
+_NoneType = type(None)
 
-def is_generic_alias_of(to_check, type_def):
+
+def is_generic_alias_of(to_check, type_def) -> bool:
     """
     :param to_check: the type that is supposed to be a generic alias of ``type_def`` if this function returns ``True``.
     :param type_def: the type that is supposed to be a generic version of ``to_check`` if this function returns \
@@ -32,7 +40,7 @@ def is_generic_alias_of(to_check, type_def):
     return False
 
 
-def is_none_type(to_check):
+def is_none_type(to_check) -> bool:
     """
     :param to_check: the type to check.
     :return: ``True`` if ``to_check`` is either ``NoneType`` or ``None`` (acceptable alias of ``NoneType``).
@@ -55,12 +63,19 @@ def is_any_type(type_def) -> bool:
     if type_def is typing.Any:
         return True
 
-    if isinstance(type_def, _GenericAlias) and type_def.__origin__ == typing.Union:
+    if isinstance(type_def, _GenericAlias) and type_def.__origin__ is typing.Union:
         return any(is_any_type(x) for x in type_def.__args__)
 
     return False
 
 
+_callable_signature_field = "__grundzeug_callable_signature__"
+_callable_signature_cache: "WeakKeyDictionary[typing.Any, typing.Tuple[typing.Tuple[typing.Any, ...], typing.Any]]" = \
+    WeakKeyDictionary()
+_instance_callable_signature_cache: \
+    "WeakKeyDictionary[type, typing.Tuple[typing.Tuple[typing.Any, ...], typing.Any]]" = WeakKeyDictionary()
+
+
 def extract_callable_parameters_and_return_type(callable) -> typing.Tuple[typing.Tuple[typing.Any, ...], typing.Any]:
     """
     :param callable: the callable to extract the parameters and the return type from. May be a function, \
@@ -68,10 +83,32 @@ def extract_callable_parameters_and_return_type(callable) -> typing.Tuple[typing
     :return: a tuple consisting of two elements: a tuple of parameter types of the callable and the callable's return \
              type.
     """
-    if isinstance(callable, _GenericAlias) and \
-            (callable.__origin__ == typing.Callable or callable.__origin__ == collections.abc.Callable):
-        return callable.__args__[:-1], callable.__args__[-1]
-
+    if isinstance(callable, _GenericAlias) and callable.__origin__ is collections.abc.Callable:
+        # Generic aliases are immutable, so the arguments are only split once per alias.
+        res = callable.__dict__.get(_callable_signature_field)
+        if res is None:
+            res = callable.__args__[:-1], callable.__args__[-1]
+            callable.__dict__[_callable_signature_field] = res
+        return res
+
+    # inspect.signature is slow, and the same callables get compared over and over again.
+    cache, cache_key = _callable_signature_cache, callable
+    if not isinstance(callable, type) and inspect.isfunction(getattr(type(callable), "__call__", None)):
+        # All instances of a callable class share the signature of its __call__ method, and new instances would never
+        # be found in the cache, so the signature is cached by class.
+        cache, cache_key = _instance_callable_signature_cache, type(callable)
+    try:
+        res = cache.get(cache_key)
+    except TypeError:
+        # The callable can't be weakly referenced or hashed.
+        return _extract_callable_parameters_and_return_type(callable)
+    if res is None:
+        res = _extract_callable_parameters_and_return_type(callable)
+        cache[cache_key] = res
+    return res
+
+
+def _extract_callable_parameters_and_return_type(callable) -> typing.Tuple[typing.Tuple[typing.Any, ...], typing.Any]:
     is_function = isinstance(callable, type(_check_callable_signature))
     signature: inspect.Signature = inspect.signature(callable if is_function else callable.__call__)
     params = [x.annotation for x in signature.parameters.values()]
@@ -81,7 +118,7 @@ def extract_callable_parameters_and_return_type(callable) -> typing.Tuple[typing
     return tuple(params), signature.return_annotation
 
 
-def _check_callable_signature(to_check, type_def, check_more_specific):
+def _check_callable_signature(to_check, type_def, check_more_specific: bool) -> bool:
     if not is_callable(to_check, allow_callable_class=True):
         return False
     to_check_args, to_check_ret = extract_callable_parameters_and_return_type(to_check)
@@ -116,17 +153,20 @@ def is_callable(type_def, allow_callable_class: bool = False) -> bool:
     if isinstance(type_def, typing._SpecialForm):
         return False
     if isinstance(type_def, _GenericAlias):
-        if type_def.__origin__ == typing.Callable or type_def.__origin__ == collections.abc.Callable:
+        origin = type_def.__origin__
+        if origin is collections.abc.Callable:
             return True
         if type_def._special:
             return False
-        return is_callable(type_def.__origin__, allow_callable_class=allow_callable_class)
-    if allow_callable_class and hasattr(type_def, "__call__"):
+        return is_callable(origin, allow_callable_class=allow_callable_class)
+    # Special methods are looked up on the type, so there is no need to go through the instance attributes (and the
+    # exception handling done by hasattr) here.
+    if allow_callable_class and getattr(type(type_def), "__call__", None) is not None:
         return True
     return False
 
 
-def can_substitute(to_check, type_def, assume_cant_substitute=False) -> bool:
+def can_substitute(to_check, type_def, assume_cant_substitute: bool = False) -> bool:
     """
     Checks whether ``to_check`` can substitute ``type_def`` according to the Liskov Substitution Principle.
 
@@ -190,7 +230,7 @@ def can_substitute(to_check, type_def, assume_cant_substitute=False) -> bool:
     return _can_substitute_impl(to_check, type_def, False, assume_cant_substitute)
 
 
-def is_weak_overload_of(to_check, type_def, assume_cant_substitute=False):
+def is_weak_overload_of(to_check, type_def, assume_cant_substitute: bool = False) -> bool:
     """
     Checks whether ``to_check`` is at least as specific as ``type_def``.
 
@@ -215,82 +255,183 @@ def is_weak_overload_of(to_check, type_def, assume_cant_substitute=False):
     return _can_substitute_impl(to_check, type_def, True, assume_cant_substitute)
 
 
-def _can_substitute_impl(to_check, type_def, check_is_weak_overload_of, assume_cant_substitute):
-    if is_none_type(type_def):
-        return is_none_type(to_check)
+def can_substitute_many(
+        to_checks: typing.Iterable[typing.Any],
+        type_def,
+        assume_cant_substitute: bool = False
+) -> typing.List[bool]:
+    """
+    Checks which of the types in ``to_checks`` can substitute ``type_def``. Equivalent to
+    ``[can_substitute(x, type_def, assume_cant_substitute) for x in to_checks]``, but the properties of ``type_def``
+    that don't depend on the candidate are only examined once.
 
+    :param to_checks: the types that should be checked against ``type_def``.
+    :param type_def: the type that the candidates should be able to substitute.
+    :param assume_cant_substitute: if ``True``, this function will return ``False`` instead of throwing a \
+                                   ``ValueError`` for candidates which can't be compared.
+    :return: a list containing ``can_substitute(x, type_def)`` for each ``x`` in ``to_checks``, in order.
+    :raises ValueError: if the arguments are not supported and ``assume_cant_substitute`` is ``False``.
+    :raises NotImplementedError: if ``type_def`` is a covariant or a contravariant :py:class:`~typing.TypeVar`.
+    """
+    if type_def is None or type_def is _NoneType:
+        return [to_check is None or to_check is _NoneType for to_check in to_checks]
     if is_any_type(type_def):
+        return [True for _ in to_checks]
+    return [_can_substitute_impl(to_check, type_def, False, assume_cant_substitute) for to_check in to_checks]
+
+
+# Results of _can_substitute_impl. The same pairs of types get compared over and over again during bean resolution
+# (e.g. when choosing converters), and each comparison may walk unions, tuples and generic arguments recursively.
+# The cache is keyed by the types themselves rather than by their ids, because ids may be reused after a type is
+# garbage-collected. The oldest entries are evicted once the cache is full. Registering a virtual subclass with
+# ABCMeta.register changes the results of issubclass, so the cache is dropped whenever abc's cache token changes.
+_can_substitute_cache: typing.Dict[typing.Tuple[typing.Any, typing.Any, bool, bool], bool] = {}
+_can_substitute_cache_token = abc.get_cache_token()
+_CAN_SUBSTITUTE_CACHE_MAXSIZE = 4096
+
+
+def _can_substitute_impl(
+        to_check,
+        type_def,
+        check_is_weak_overload_of: bool,
+        assume_cant_substitute: bool
+) -> bool:
+    if to_check is type_def and isinstance(to_check, type):
+        # Every class can substitute itself, so there's no need to hash the key. This doesn't hold for all identical
+        # arguments: e.g. a constrained TypeVar can't substitute itself.
         return True
+    global _can_substitute_cache_token
+    token = abc.get_cache_token()
+    if token != _can_substitute_cache_token:
+        _can_substitute_cache.clear()
+        _can_substitute_cache_token = token
+    key = (to_check, type_def, check_is_weak_overload_of, assume_cant_substitute)
+    try:
+        res = _can_substitute_cache.get(key)
+    except TypeError:
+        # One of the arguments is unhashable.
+        return _can_substitute_uncached(to_check, type_def, check_is_weak_overload_of, assume_cant_substitute)
+    if res is None:
+        res = _can_substitute_uncached(to_check, type_def, check_is_weak_overload_of, assume_cant_substitute)
+        if len(_can_substitute_cache) >= _CAN_SUBSTITUTE_CACHE_MAXSIZE:
+            del _can_substitute_cache[next(iter(_can_substitute_cache))]
+        _can_substitute_cache[key] = res
+    return res
+
+
+def _can_substitute_uncached(
+        to_check,
+        type_def,
+        check_is_weak_overload_of: bool,
+        assume_cant_substitute: bool
+) -> bool:
+    # The checks done by is_none_type and is_any_type are inlined here, since they are performed for every pair of
+    # types that gets compared.
+    if type_def is None or type_def is _NoneType:
+        return to_check is None or to_check is _NoneType
+
+    # Comparing two plain classes is the most common case. None of the rules below apply to such pairs before the final
+    # issubclass check (apart from NoneType never substituting anything), so they are dispatched first. Keep this
+    # check above the generic alias handling when reordering the rules.
+    if type(type_def) is type and isinstance(to_check, type) and to_check is not _NoneType:
+        return issubclass(to_check, type_def)
 
-    if is_any_type(to_check):
+    # The origins of generic aliases are classes or special forms, which are singletons, so they can be compared by
+    # identity. Note that the origin of typing.Callable[...] is collections.abc.Callable.
+    to_check_origin = to_check.__origin__ if isinstance(to_check, _GenericAlias) else None
+    type_def_origin = type_def.__origin__ if isinstance(type_def, _GenericAlias) else None
+
+    if type_def is typing.Any or (type_def_origin is typing.Union and is_any_type(type_def)):
+        return True
+
+    if to_check is typing.Any or (to_check_origin is typing.Union and is_any_type(to_check)):
         return False
 
     if isinstance(type_def, typing.TypeVar):
         if type_def.__covariant__ or type_def.__contravariant__:
             raise NotImplementedError(f"TypeVar covariance and contravariance is currently not supported.")
-        if len(type_def.__constraints__) > 0:
-            return any(to_check == x for x in type_def.__constraints__)
-        if type_def.__bound__ is not None:
-            return _can_substitute_impl(to_check, type_def.__bound__, check_is_weak_overload_of, assume_cant_substitute)
+        constraints = type_def.__constraints__
+        if len(constraints) > 0:
+            return any(to_check == x for x in constraints)
+        bound = type_def.__bound__
+        if bound is not None:
+            return _can_substitute_impl(to_check, bound, check_is_weak_overload_of, assume_cant_substitute)
         return True
 
-    if isinstance(type_def, _GenericAlias):
-        if type_def.__origin__ == typing.Union:
+    if type_def_origin is not None:
+        if type_def_origin is typing.Union:
             # Handles both Union and Optional
             return _is_assignable_union(to_check, type_def)
-        elif type_def.__origin__ == tuple:
-            if not isinstance(to_check, _GenericAlias):
+        elif type_def_origin is tuple:
+            if to_check_origin is None:
                 return False
             args_def = type_def.__args__
             args_to_check = to_check.__args__
             return _check_tuple_args_compatibility(args_to_check, args_def)
-        elif type_def.__origin__ == typing.Callable or type_def.__origin__ == collections.abc.Callable:
+        elif type_def_origin is collections.abc.Callable:
             return _check_callable_signature(to_check, type_def, check_is_weak_overload_of)
         else:
-            if not isinstance(to_check, _GenericAlias):
+            if to_check_origin is None:
                 if all(isinstance(x, typing.TypeVar) for x in type_def.__args__):
                     # Generic class origin is assignable to its non-specialized generic wrapper
-                    return can_substitute(to_check, type_def.__origin__)
+                    return _can_substitute_impl(to_check, type_def_origin, False, False)
                 return False
-            if not can_substitute(to_check.__origin__, type_def.__origin__):
+            if not _can_substitute_impl(to_check_origin, type_def_origin, False, False):
                 return False
-            args1 = {k: v for k, v in zip(to_check.__origin__.__parameters__, to_check.__args__)}
-            for k, v in zip(type_def.__origin__.__parameters__, type_def.__args__):
-                if not can_substitute(args1[k], v):
+            to_check_parameters = to_check_origin.__parameters__
+            type_def_parameters = type_def_origin.__parameters__
+            to_check_args = to_check.__args__
+            type_def_args = type_def.__args__
+            if to_check_parameters is type_def_parameters:
+                # Both aliases specialize the same generic class, so the type arguments can be compared pairwise.
+                for to_check_arg, type_def_arg in zip(to_check_args, type_def_args):
+                    if not _can_substitute_impl(to_check_arg, type_def_arg, False, False):
+                        return False
+                return True
+            args1 = {k: v for k, v in zip(to_check_parameters, to_check_args)}
+            for k, v in zip(type_def_parameters, type_def_args):
+                if not _can_substitute_impl(args1[k], v, False, False):
                     return False
             return True
 
-    if isinstance(to_check, _GenericAlias):
-        if to_check.__origin__ == typing.Union:
+    if to_check_origin is not None:
+        if to_check_origin is typing.Union:
             # Handles both Union and Optional
-            return all(can_substitute(x, type_def) for x in to_check.__args__)
-        elif to_check.__origin__ == tuple:
-            return can_substitute(tuple, type_def)
-        elif to_check.__origin__ == typing.Callable or to_check.__origin__ == collections.abc.Callable:
+            for x in to_check.__args__:
+                if not _can_substitute_impl(x, type_def, False, False):
+                    return False
+            return True
+        elif to_check_origin is tuple:
+            return _can_substitute_impl(tuple, type_def, False, False)
+        elif to_check_origin is collections.abc.Callable:
             return _check_callable_signature(to_check, type_def, check_is_weak_overload_of)
         elif hasattr(type_def, "__parameters__"):
             return _can_substitute_impl(to_check, type_def[type_def.__parameters__], check_is_weak_overload_of,
                                         assume_cant_substitute)
         # The type def is not a generic alias, so it may be a non-generic version of the class
-        return can_substitute(to_check.__origin__, type_def)
+        return _can_substitute_impl(to_check_origin, type_def, False, False)
 
-    if is_none_type(to_check):
+    if to_check is None or to_check is _NoneType:
         return False
 
     if isinstance(to_check, typing.TypeVar):
         if to_check.__covariant__ or to_check.__contravariant__:
             raise NotImplementedError(f"TypeVar covariance and contravariance is currently not supported.")
-        if len(to_check.__constraints__) > 0:
+        constraints = to_check.__constraints__
+        if len(constraints) > 0:
             return all(
                 _can_substitute_impl(x, type_def, check_is_weak_overload_of, assume_cant_substitute)
                 for x
-                in to_check.__constraints__
+                in constraints
             )
-        if to_check.__bound__ is not None:
-            return _can_substitute_impl(to_check.__bound__, type_def, check_is_weak_overload_of, assume_cant_substitute)
+        bound = to_check.__bound__
+        if bound is not None:
+            return _can_substitute_impl(bound, type_def, check_is_weak_overload_of, assume_cant_substitute)
         return to_check is type_def
 
-    if inspect.isclass(to_check):
+    if isinstance(to_check, type):
+        # issubclass isn't cached separately: the result for this pair is memoized by _can_substitute_impl, which
+        # drops its memo whenever ABCMeta.register changes abc's cache token.
         return issubclass(to_check, type_def)
 
     if assume_cant_substitute:
@@ -299,29 +440,93 @@ def _can_substitute_impl(to_check, type_def, check_is_weak_overload_of, assume_c
     raise ValueError(f"Unsupported arguments: {to_check}, {type_def}")
 
 
-def _is_assignable_union(to_check, type_def):
-    if isinstance(to_check, _GenericAlias) and to_check.__origin__ == typing.Union:
+_union_arguments_field = "__grundzeug_union_args__"
+
+
+def _get_union_argument_set(type_def) -> typing.FrozenSet[typing.Any]:
+    # typing already removes duplicate arguments from unions, but looking a class up in a set is much cheaper than
+    # comparing it with each argument, some of which may be generic aliases with Python-level __eq__ methods.
+    argument_set = type_def.__dict__.get(_union_arguments_field)
+    if argument_set is None:
+        argument_set = frozenset(type_def.__args__)
+        type_def.__dict__[_union_arguments_field] = argument_set
+    return argument_set
+
+
+_class_arguments_field = "__grundzeug_class_args__"
+
+
+def _get_class_arguments(type_def) -> typing.Optional[typing.Tuple[type, ...]]:
+    # If all arguments of a union or a tuple (e.g. Optional[SomeClass]) are plain classes, advanced_isinstance can check
+    # them with the builtin isinstance instead of going through the substitution rules.
+    class_args = type_def.__dict__.get(_class_arguments_field, False)
+    if class_args is False:
+        args = type_def.__args__
+        class_args = args if all(type(x) is type for x in args) else None
+        type_def.__dict__[_class_arguments_field] = class_args
+    return class_args
+
+
+def _is_assignable_union(to_check, type_def) -> bool:
+    args_def = type_def.__args__
+    if isinstance(to_check, _GenericAlias) and to_check.__origin__ is typing.Union:
         # Handle situation when both type definitions are Unions
-        return all(any(can_substitute(y, x) for x in type_def.__args__) for y in to_check.__args__)
-    return any(can_substitute(to_check, x) for x in type_def.__args__)
+        for y in to_check.__args__:
+            if isinstance(y, type) and y in _get_union_argument_set(type_def):
+                continue
+            for x in args_def:
+                if _can_substitute_impl(y, x, False, False):
+                    break
+            else:
+                return False
+        return True
+    if isinstance(to_check, type) and to_check in _get_union_argument_set(type_def):
+        # Every class can substitute itself.
+        return True
+    for x in args_def:
+        if _can_substitute_impl(to_check, x, False, False):
+            return True
+    return False
 
 
 def _check_tuple_args_compatibility(
-        args_def: typing.Sequence[typing.Any],
-        args_to_check: typing.Sequence[typing.Any]
+        args_to_check: typing.Sequence[typing.Any],
+        args_def: typing.Sequence[typing.Any]
 ) -> bool:
+    # Most tuple annotations have a fixed arity, so the Ellipsis handling is kept out of their way.
     if len(args_def) == 2 and args_def[1] is Ellipsis:
-        if len(args_to_check) == 2 and args_to_check[1] is Ellipsis:
-            # Tuple[x, ...] is assignable to Tuple[y, ...] iff x is assignable to y
-            return can_substitute(args_to_check[0], args_def[0])
-        # Tuple[x1, x2,,, xn] is assignable to Tuple[y, ...] iff x1, ..., xn are all assignable to y
-        return all(can_substitute(x, args_def[0]) for x in args_to_check)
-    # Tuple[x, ...] is not assignable to Tuple[y1, y2,,, yn]
+        return _check_variadic_tuple_args(args_to_check, args_def[0])
+    return _check_fixed_tuple_args(args_to_check, args_def)
+
+
+def _check_fixed_tuple_args(
+        args_to_check: typing.Sequence[typing.Any],
+        args_def: typing.Sequence[typing.Any]
+) -> bool:
+    if len(args_to_check) != len(args_def):
+        return False
+    # Tuple[x, ...] is not assignable to Tuple[y1, y2]
     if len(args_to_check) == 2 and args_to_check[1] is Ellipsis:
         return False
     # Tuple[x1, x2,,, xn] is assignable to Tuple[y1, y2,,, yn] iff xi is assignable to yi for all i.
-    return len(args_def) == len(args_to_check) \
-           and all(can_substitute(x, y) for x, y in zip(args_def, args_to_check))
+    for x, y in zip(args_to_check, args_def):
+        if not _can_substitute_impl(x, y, False, False):
+            return False
+    return True
+
+
+def _check_variadic_tuple_args(
+        args_to_check: typing.Sequence[typing.Any],
+        element_def
+) -> bool:
+    if len(args_to_check) == 2 and args_to_check[1] is Ellipsis:
+        # Tuple[x, ...] is assignable to Tuple[y, ...] iff x is assignable to y
+        return _can_substitute_impl(args_to_check[0], element_def, False, False)
+    # Tuple[x1, x2,,, xn] is assignable to Tuple[y, ...] iff x1, ..., xn are all assignable to y
+    for x in args_to_check:
+        if not _can_substitute_impl(x, element_def, False, False):
+            return False
+    return True
 
 
 def advanced_isinstance(instance, type_def) -> bool:
@@ -346,29 +551,70 @@ def advanced_isinstance(instance, type_def) -> bool:
     :param type_def: The type definition that should include ``instance`` if this function returns ``True``.
     :return: ``True`` if ``instance`` satisfies the type constraint ``type_def``, ``False`` otherwise.
     """
+    if type(type_def) is type and instance is not None:
+        # Plain classes are by far the most common type definitions. For them, the substitution rules boil down to
+        # issubclass(type(instance), type_def), which the builtin isinstance checks without any Python-level calls.
+        # None is excluded, because NoneType can't substitute anything but itself (not even object).
+        return isinstance(instance, type_def)
+    if type(instance) is type_def:
+        # Classes with custom metaclasses (e.g. ABCs) end up here. An instance of exactly the requested class always
+        # matches it.
+        return True
     if isinstance(type_def, _GenericAlias):
-        if type_def.__origin__ == typing.Union:
+        origin = type_def.__origin__
+        if origin is typing.Union:
             # Handles both Union and Optional
-            return any(advanced_isinstance(instance, x) for x in type_def.__args__)
-        elif type_def.__origin__ == tuple:
+            class_args = _get_class_arguments(type_def)
+            if class_args is not None and instance is not None:
+                return isinstance(instance, class_args)
+            for x in type_def.__args__:
+                if advanced_isinstance(instance, x):
+                    return True
+            return False
+        elif origin is tuple:
             args_def = type_def.__args__
-            if not can_substitute(type(instance), tuple):
+            if not _can_substitute_impl(type(instance), tuple, False, False):
                 return False
-            return _check_tuple_args_compatibility(tuple(type(x) for x in instance), args_def)
-        elif type_def.__origin__ == typing.Callable or type_def.__origin__ == collections.abc.Callable:
+            class_args = _get_class_arguments(type_def)
+            if class_args is not None:
+                if len(instance) != len(class_args):
+                    return False
+                for x, y in zip(instance, class_args):
+                    if x is None:
+                        # The builtin isinstance would accept None for object, which NoneType can't substitute.
+                        if not _can_substitute_impl(_NoneType, y, False, False):
+                            return False
+                    elif not isinstance(x, y):
+                        return False
+                return True
+            if len(args_def) == 2 and args_def[1] is Ellipsis:
+                # Tuple[y, ...] accepts tuples of any length, as long as all elements are instances of y
+                for x in instance:
+                    if not _can_substitute_impl(type(x), args_def[0], False, False):
+                        return False
+                return True
+            if len(instance) != len(args_def):
+                return False
+            for x, y in zip(instance, args_def):
+                if not _can_substitute_impl(type(x), y, False, False):
+                    return False
+            return True
+        elif origin is collections.abc.Callable:
             return _check_callable_signature(instance, type_def, False)
         else:
-            if can_substitute(type(instance), type_def):
+            if _can_substitute_impl(type(instance), type_def, False, False):
                 return True
             # When a class inherits a generic class, its type information is erased for some reason.
             # TODO: Check what can be done about this. Maybe @generic_aware classes should be handled differently?
             for base in type(instance).__bases__:
-                if can_substitute(base, type_def.__origin__):
+                if _can_substitute_impl(base, origin, False, False):
                     return True
             return False
 
-    return can_substitute(type(instance), type_def)
+    # The substitution checks are memoized, so checking instances of the same type against the same type definition
+    # boils down to a dictionary lookup.
+    return _can_substitute_impl(type(instance), type_def, False, False)
 
 
 __all__ = ["is_generic_alias_of", "is_none_type", "is_any_type", "extract_callable_parameters_and_return_type",
-           "is_callable", "can_substitute", "is_weak_overload_of", "advanced_isinstance"]
+           "is_callable", "can_substitute", "can_substitute_many", "is_weak_overload_of", "advanced_isinstance"]
@@ -11,7 +11,6 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from itertools import zip_longest
 from typing import Dict, TypeVar
 
 from grundzeug.util.sentinels import make_sentinel
@@ -27,23 +26,51 @@ def dictionary_union(*dictionaries: Dict[DictKeyT, DictValueT]) -> Dict[DictKeyT
     :param dictionaries: The dictionaries to combine.
     :return: A dictionary containing the keys present in the input dictionaries.
     """
-    return dict(item for dictionary in dictionaries for item in dictionary.items())
+    result = {}
+    for dictionary in dictionaries:
+        result.update(dictionary)
+    return result
 
 
 _, _SENTINEL = make_sentinel()
 
 
+def _length_mismatch_error(pos: int, i: int) -> ValueError:
+    return ValueError(f"Iterable {pos} only had {i} elements, but the other iterables are longer! Please ensure that "
+                      f"all iterables have the same length.")
+
+
 def zip_equal(*args):
     """
     Like ``zip``, but throws an error if the number of elements in the iterables are different.
     """
-    for i, tup in enumerate(zip_longest(*args, fillvalue=_SENTINEL)):
-        tup: tuple = tup
-        if _SENTINEL in tup:
-            pos = tup.index(_SENTINEL)
-            raise ValueError(f"Iterable {pos} only had {i} elements, but the other iterables are longer! Please ensure "
-                             f"that all iterables have the same length.")
-        yield tup
+    try:
+        lengths = [len(x) for x in args]
+    except TypeError:
+        lengths = None
+    if lengths is not None:
+        # All arguments are sized, so the mismatch can be detected upfront instead of scanning each tuple for the
+        # sentinel, which would compare every element with it.
+        yield from zip(*args)
+        if len(lengths) > 0 and min(lengths) != max(lengths):
+            i = min(lengths)
+            raise _length_mismatch_error(lengths.index(i), i)
+        return
+
+    iterators = [iter(x) for x in args]
+    if len(iterators) == 0:
+        return
+    i = 0
+    while True:
+        values = [next(iterator, _SENTINEL) for iterator in iterators]
+        # "_SENTINEL in values" would call the __eq__ methods of the elements, so look for the sentinel by identity.
+        for pos, x in enumerate(values):
+            if x is _SENTINEL:
+                if all(y is _SENTINEL for y in values):
+                    return
+                raise _length_mismatch_error(pos, i)
+        yield tuple(values)
+        i += 1
 
 
 __all__ = ["dictionary_union", "zip_equal"]
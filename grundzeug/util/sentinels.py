@@ -24,7 +24,8 @@ def make_sentinel() -> Tuple[Type[T], T]:
     """
 
     class _Sentinel():
-        pass
+        # Sentinels only ever need to be compared by identity, which is what object.__eq__ does.
+        __slots__ = ()
 
     return _Sentinel, _Sentinel()
 
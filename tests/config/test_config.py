@@ -1,3 +1,4 @@
+import weakref
 from typing import Tuple
 
 import pytest
@@ -247,3 +248,46 @@ class TestConfig:
     def test_child_configuration_class_field(self, full_container):
         assert full_container.resolve[ExampleParentConfigurationClassWithRelativePath.child.property]() == 42
         assert full_container.resolve[ExampleParentConfigurationClassWithRelativePath.child.default_property]() == 32
+
+    def test_configuration_provider_registered_after_resolution(self, full_container):
+        child_container = Container(full_container)
+        assert full_container.resolve[ExampleConfigurationClass.property]() == 42
+        assert child_container.resolve[ExampleConfigurationClass.property]() == 42
+
+        full_container.register_instance[BeanList[ConfigurationProvider]](
+            DictTreeConfigurationProvider({
+                "foo": {
+                    "bar": {
+                        "baz": "43"
+                    }
+                }
+            })
+        )
+        assert full_container.resolve[ExampleConfigurationClass.property]() == 43
+        assert child_container.resolve[ExampleConfigurationClass.property]() == 43
+
+    def test_converter_registered_after_resolution(self):
+        container = Container()
+        container.add_plugin(ContainerConfigurationResolutionPlugin())
+        container.add_plugin(ContainerConverterResolutionPlugin())
+        container.register_instance[BeanList[ConfigurationProvider]](
+            DictTreeConfigurationProvider({
+                "foo": {
+                    "bar": {
+                        "baz": "42"
+                    }
+                }
+            })
+        )
+        child_container = Container(container)
+        with pytest.raises(ValueError):
+            child_container.resolve[ExampleConfigurationClass.property]()
+
+        container.register_instance[Converter[str, int]](Converter[str, int].cast())
+        assert child_container.resolve[ExampleConfigurationClass.property]() == 42
+
+    def test_parametrized_configurable_has_no_instance_dict(self):
+        configurable = Configurable[int]("foo", default=1)
+        assert not hasattr(configurable, "__dict__")
+        assert weakref.ref(configurable)() is configurable
+        assert configurable.configurable_metadata.clazz is int
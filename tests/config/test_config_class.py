@@ -35,6 +35,11 @@ class TestConfigClass:
         assert ExampleConfigurationClass.property.configurable_metadata.full_path == ('foo', 'bar', 'baz')
         assert ExampleConfigurationClassInheritor.property.configurable_metadata.full_path == ('foo2', 'bar2', 'baz')
 
+    def test_inheritance_collects_fields(self):
+        fields = ExampleConfigurationClassInheritor.__grundzeug_configuration__.fields
+        assert [k for k, _ in fields] == ["property", "default_property"]
+        assert fields[0][1] is ExampleConfigurationClassInheritor.property
+
     @pytest.fixture()
     def container(self):
         container = Container()
@@ -1,5 +1,6 @@
 from argparse import ArgumentParser
 
+from grundzeug.config.common import MISSING
 from grundzeug.config.providers.argparse import ArgParseConfigurationProvider
 from grundzeug.config.providers.common import DictTreeConfigurationProvider
 from tests.config.test_config import ExampleConfigurationClass
@@ -19,3 +20,22 @@ class TestProviders:
         provider = DictTreeConfigurationProvider({})
         provider.set_value(ExampleConfigurationClass.property, 42)
         assert provider.get_value(["foo", "bar", "baz"]) == 42
+
+    def test_dict_tree_provider_available_keys(self):
+        provider = DictTreeConfigurationProvider({"foo": {"boo": "32"}})
+        assert provider.available_keys() == {("foo",), ("foo", "boo")}
+        provider.set_value(ExampleConfigurationClass.property, 42)
+        assert provider.available_keys() == {("foo",), ("foo", "boo"), ("foo", "bar"), ("foo", "bar", "baz")}
+
+    def test_dict_tree_provider_set_value_after_get_value(self):
+        provider = DictTreeConfigurationProvider({})
+        assert provider.get_value(["foo", "bar", "baz"]) is MISSING
+        provider.set_value(ExampleConfigurationClass.property, 42)
+        assert provider.get_value(["foo", "bar", "baz"]) == 42
+        provider.set_value(ExampleConfigurationClass.property, 43)
+        assert provider.get_value(["foo", "bar", "baz"]) == 43
+
+    def test_dict_tree_provider_path_through_value(self):
+        provider = DictTreeConfigurationProvider({"foo": {"bar": "baz"}})
+        assert provider.get_value(["foo", "bar"]) == "baz"
+        assert provider.get_value(["foo", "bar", "baz"]) is MISSING
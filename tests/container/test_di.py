@@ -9,8 +9,9 @@ from typing_extensions import Annotated
 
 from grundzeug.container.di import injectable, inject_value, Inject, InjectNamed
 from grundzeug.container.impl import Container
+from grundzeug.container.interface import Injector
 from grundzeug.container.registrations import TransientFactoryContainerRegistration, \
-    HierarchicalFactoryContainerRegistration
+    HierarchicalFactoryContainerRegistration, RegistrationTypes
 
 
 class IBean(ABC):
@@ -89,6 +90,19 @@ def injectable_func_field(
     return arg, kwarg, bean, named_bean
 
 
+class _FinalizationRecorder:
+    """
+    Records the names of watched objects once they are finalized. The finalizers call a bound method of a set, so they
+    don't keep anything but the recorder's set alive.
+    """
+
+    def __init__(self):
+        self.finalized = set()
+
+    def watch(self, obj, name: str):
+        weakref.finalize(obj, self.finalized.add, name)
+
+
 injectable_func_parametrize = pytest.mark.parametrize(
     "func",
     [
@@ -264,14 +278,46 @@ class TestDI:
         assert isinstance(second_bean.named_bean, Bean)
         assert second_bean.named_bean.foo == "bar_named_bean"
 
+    def test_injectable_init_planned_at_decoration(self):
+        from grundzeug.container.di.injection import _bound_method_injection_plan_cache
+
+        @injectable
+        class _Planned:
+            def __init__(self, arg: int, bean: Inject[IBean]):
+                self.arg = arg
+                self.bean = bean
+
+        plan = _bound_method_injection_plan_cache[_Planned.__init__]
+        assert "self" not in plan[1].parameters
+
+        container = Container()
+        container.register_factory[IBean](lambda: Bean("unnamed_bean"))
+        instance = container.inject(_Planned)(42)
+        assert instance.arg == 42
+        assert instance.bean.foo == "bar_unnamed_bean"
+        assert _bound_method_injection_plan_cache[_Planned.__init__] is plan
+
+    def test_bound_method_injection(self):
+        class Owner:
+            def __init__(self, name: str):
+                self.name = name
+
+            def method(self, arg: int, bean: Inject[IBean]):
+                return self.name, arg, bean.foo
+
+        container = Container()
+        container.register_factory[IBean](lambda: Bean("unnamed_bean"))
+        first, second = Owner("first"), Owner("second")
+        for _ in range(2):
+            assert container.inject(first.method)(42) == ("first", 42, "bar_unnamed_bean")
+            assert container.inject(second.method)(43) == ("second", 43, "bar_unnamed_bean")
+
     @injectable_func_parametrize
     def test_func_instance_injection_finalizer_called(self, func):
         container = Container()
         container2 = Container(container)
 
         bean_removed = False
-        plugin_storage_removed = False
-        container2_removed = False
 
         class _Bean():
             def __del__(self):
@@ -280,24 +326,16 @@ class TestDI:
 
         bean = _Bean()
 
-        def mark_bean_removed():
-            nonlocal plugin_storage_removed
-            plugin_storage_removed = True
-
-        def mark_container2_removed():
-            nonlocal container2_removed
-            container2_removed = True
-
-        weakref.finalize(container2._plugin_storage, mark_bean_removed)
-        weakref.finalize(container2, mark_container2_removed)
+        recorder = _FinalizationRecorder()
+        recorder.watch(container2._plugin_storage, "plugin_storage")
+        recorder.watch(container2, "container2")
 
         container2.register_instance[IBean](bean)
         container2.register_instance[IBean](bean, bean_name="named_bean")
         container2.inject(func)(42, kwarg="baz")
 
         assert bean_removed == False
-        assert plugin_storage_removed == False
-        assert container2_removed == False
+        assert recorder.finalized == set()
         assert len(container2._plugin_storage) == 1
 
         del bean
@@ -305,8 +343,52 @@ class TestDI:
         gc.collect()
 
         assert bean_removed == True
-        assert plugin_storage_removed == True
-        assert container2_removed == True
+        assert recorder.finalized == {"plugin_storage", "container2"}
+
+    def test_registration_type_enum(self):
+        container = Container()
+        container.register_factory[IBean](
+            lambda: Bean("transient_bean"),
+            registration_type=RegistrationTypes.Transient
+        )
+        container.register_factory[IBean](
+            lambda: Bean("container_bean"),
+            bean_name="container_bean",
+            registration_type=RegistrationTypes.Container
+        )
+        assert container.resolve[IBean]() is not container.resolve[IBean]()
+        assert container.resolve[IBean]("container_bean") is container.resolve[IBean]("container_bean")
+
+    def test_hierarchical_values_removed_with_container(self):
+        container = Container()
+        container.register_factory[IBean](
+            lambda: Bean("unnamed_bean"),
+            registration_type=HierarchicalFactoryContainerRegistration
+        )
+        child_container = Container(container)
+        bean = child_container.resolve[IBean]()
+        assert child_container.resolve[IBean]() is bean
+        assert container.resolve[IBean]() is not bean
+
+        recorder = _FinalizationRecorder()
+        recorder.watch(bean, "bean")
+        del bean
+        del child_container
+        gc.collect()
+
+        assert recorder.finalized == {"bean"}
+
+    def test_container_removed_after_injector_resolution(self):
+        container = Container()
+        child_container = Container(container)
+        assert child_container.resolve[Injector]() is child_container.resolve[Injector]()
+
+        recorder = _FinalizationRecorder()
+        recorder.watch(child_container, "child_container")
+        del child_container
+        gc.collect()
+
+        assert recorder.finalized == {"child_container"}
 
     def test_shortened_type_annotation(self):
         def injectable_func(bean: Annotated[IBean, Inject]):
@@ -316,3 +398,14 @@ class TestDI:
         container.register_instance[IBean](Bean("test"))
         injected_func = container.inject(injectable_func)
         assert injected_func() == 42
+
+    def test_children_registered_without_uuid(self):
+        container = Container()
+        child_container = Container(container)
+        assert container.children == [child_container]
+        assert child_container._Container__uuid is None
+
+        del child_container
+        gc.collect()
+
+        assert container.children == []
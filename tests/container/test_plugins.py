@@ -11,14 +11,18 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import abc
+import copy
+import dataclasses
 from typing import Any, Tuple
 
 import pytest
 
-from grundzeug.container import Container, RegistrationKey, Injector
+from grundzeug.container import Container, RegistrationKey, Injector, BEAN_NOT_FOUND
 from grundzeug.container.di import Inject, inject_value
 from grundzeug.container.plugins import BeanList, ContainerBeanListResolutionPlugin
 from grundzeug.container.plugins.ContainerConverterResolutionPlugin import ContainerConverterResolutionPlugin
+from grundzeug.container.registrations import TransientFactoryContainerRegistration
 from grundzeug.container.utils import lookup_container_plugin_by_type
 from grundzeug.converters import Converter
 from tests.container.test_di import IBean
@@ -80,6 +84,48 @@ class TestContainerResolutionPlugins:
         assert len(z) == 2
         assert {v.foo for v in z} == {"bar", "baz"}
 
+    def test_bean_list_resolution_from_child_container(self):
+        container = Container()
+        bean1 = Bean()
+        bean2 = Bean2()
+        container.register_instance[BeanList[IBean]](bean1)
+        container.register_instance[BeanList[IBean]](bean2)
+        child_container = Container(container)
+        grandchild_container = Container(child_container)
+        bean3 = Bean()
+        grandchild_container.register_instance[BeanList[IBean]](bean3)
+
+        assert tuple(child_container.resolve[BeanList[IBean]]()) == (bean1, bean2)
+        assert tuple(grandchild_container.resolve[BeanList[IBean]]()) == (bean3, bean1, bean2)
+
+    def test_empty_bean_list_resolution(self):
+        container = Container()
+        container.register_instance[BeanList[IBean]](Bean())
+        child_container = Container(container)
+
+        beans = child_container.resolve[BeanList[Bean2]]()
+        assert isinstance(beans, BeanList)
+        assert len(beans) == 0
+
+    def test_bean_list_reused_for_idempotent_registrations(self):
+        container = Container()
+        container.register_instance[BeanList[IBean]](Bean())
+        container.register_factory[BeanList[IBean]](lambda: Bean2())
+
+        beans = container.resolve[BeanList[IBean]]()
+        assert container.resolve[BeanList[IBean]]() is beans
+
+    def test_bean_list_rebuilt_for_transient_registrations(self):
+        container = Container()
+        container.register_instance[BeanList[IBean]](Bean())
+        container.register_factory[BeanList[IBean]](lambda: Bean2(),
+                                                     registration_type=TransientFactoryContainerRegistration)
+
+        first_beans = container.resolve[BeanList[IBean]]()
+        second_beans = container.resolve[BeanList[IBean]]()
+        assert first_beans[0] is second_beans[0]
+        assert first_beans[1] is not second_beans[1]
+
     def test_bean_list_plugin_returns_registrations(self):
         container = Container()
         container.register_factory[BeanList[IBean]](lambda: Bean())
@@ -90,6 +136,17 @@ class TestContainerResolutionPlugins:
         for registration_key, registration in registrations:
             assert isinstance(registration_key, RegistrationKey)
 
+    def test_plugin_lookup_after_adding_plugin(self):
+        container = Container()
+        child_container = Container(container)
+        plugin = lookup_container_plugin_by_type(child_container, ContainerBeanListResolutionPlugin)
+        assert lookup_container_plugin_by_type(child_container, ContainerBeanListResolutionPlugin) is plugin
+
+        new_plugin = ContainerBeanListResolutionPlugin()
+        container.add_plugin(new_plugin)
+        assert lookup_container_plugin_by_type(child_container, ContainerBeanListResolutionPlugin) is new_plugin
+        assert lookup_container_plugin_by_type(container, ContainerBeanListResolutionPlugin) is new_plugin
+
     def test_converter_resolution(self):
         container = Container()
         container.add_plugin(ContainerConverterResolutionPlugin())
@@ -107,3 +164,40 @@ class TestContainerResolutionPlugins:
 
         str_to_obj = container.resolve[Converter[str, object]]()
         assert str_to_obj("3") == "3"
+
+    def test_converter_resolution_after_abc_register(self):
+        class _Abstract(abc.ABC):
+            pass
+
+        class _Concrete:
+            pass
+
+        container = Container()
+        container.add_plugin(ContainerConverterResolutionPlugin())
+        container.register_instance[Converter[str, _Concrete]](Converter[str, _Concrete].cast())
+        assert container.try_resolve[Converter[str, _Abstract]]() is BEAN_NOT_FOUND
+
+        _Abstract.register(_Concrete)
+        assert container.try_resolve[Converter[str, _Abstract]]() is not BEAN_NOT_FOUND
+
+    def test_converter_compatibility_after_abc_register(self):
+        class _Abstract(abc.ABC):
+            pass
+
+        class _Concrete:
+            pass
+
+        plugin = ContainerConverterResolutionPlugin()
+        requested_key = RegistrationKey(Converter[str, _Abstract], None)
+        registered_key = RegistrationKey(Converter[str, _Concrete], None)
+        assert not plugin.is_registration_compatible_with_requested_key(requested_key, registered_key)
+
+        _Abstract.register(_Concrete)
+        assert plugin.is_registration_compatible_with_requested_key(requested_key, registered_key)
+
+    def test_registration_key_hash_memo_is_not_a_field(self):
+        key = RegistrationKey(Tuple[int, str], "name")
+        assert hash(key) == hash(RegistrationKey(Tuple[int, str], "name"))
+        assert [f.name for f in dataclasses.fields(key)] == ["bean_contract", "bean_name"]
+        assert dataclasses.asdict(key) == {"bean_contract": Tuple[int, str], "bean_name": "name"}
+        assert "_hash" not in copy.copy(key).__dict__
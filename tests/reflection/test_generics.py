@@ -13,7 +13,7 @@
 #  limitations under the License.
 from typing import Generic, TypeVar
 
-from grundzeug.reflection.generics import generic_accessor, generic_aware, get_type_arguments
+from grundzeug.reflection.generics import generic_accessor, generic_aware, generic_classmethod, get_type_arguments
 
 T = TypeVar("T")
 
@@ -38,6 +38,13 @@ class _DerivedGenericClassWithMethod(_GenericClassWithMethod):
     pass
 
 
+@generic_aware(process_default_classmethod=False)
+class _GenericClassWithGenericClassmethod(Generic[T]):
+    @generic_classmethod
+    def foo(cls, suffix=""):
+        return get_type_arguments(cls)[T], suffix
+
+
 class TestGenerics:
     def test_generic_accessor(self):
         cls1 = _GenericClass[int]
@@ -45,6 +52,12 @@ class TestGenerics:
         assert cls1.generic_T == int
         assert cls2.generic_T == str
 
+    def test_generic_accessor_repeated_access(self):
+        for _ in range(2):
+            assert _GenericClass[int].generic_T == int
+            assert _GenericClass[str].generic_T == str
+            assert _DerivedGenericClass[int].generic_T == int
+
     def test_generic_accessor_on_derived_class(self):
         cls1 = _DerivedGenericClass[int]
         cls2 = _DerivedGenericClass[str]
@@ -63,6 +76,11 @@ class TestGenerics:
         assert cls1.foo() == int
         assert cls2.foo() == str
 
+    def test_explicit_generic_classmethod(self):
+        assert _GenericClassWithGenericClassmethod[int].foo() == (int, "")
+        assert _GenericClassWithGenericClassmethod[str].foo(suffix="x") == (str, "x")
+        assert _GenericClassWithGenericClassmethod.foo() == (T, "")
+
     def test_get_type_arguments(self):
         T1 = TypeVar("T1")
         T2 = TypeVar("T2")
@@ -11,10 +11,11 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import abc
 import typing
 from typing import Tuple, Optional, Any
 
-from grundzeug.reflection.types import can_substitute, is_weak_overload_of, advanced_isinstance
+from grundzeug.reflection.types import can_substitute, is_weak_overload_of, advanced_isinstance, can_substitute_many
 
 
 class BaseClass1:
@@ -45,6 +46,20 @@ class DerivedGenericClass(typing.Generic[T2, T1], GenericClass[T1]):
     pass
 
 
+TB = typing.TypeVar("TB", bound=BaseClass1)
+
+
+class GenericClassBound(typing.Generic[TB]):
+    pass
+
+
+TC = typing.TypeVar("TC", BaseClass1, int)
+
+
+class GenericClassConstraint(typing.Generic[TC]):
+    pass
+
+
 class CallableClass:
     def __call__(self, test: str, test2: float) -> int:
         pass
@@ -58,9 +73,28 @@ class TestTypes:
         assert can_substitute(None, Any)
         assert can_substitute(Tuple[DerivedClass1, DerivedClass2], Any)
 
+    def test_can_substitute_after_abc_register(self):
+        class _Abstract(abc.ABC):
+            pass
+
+        class _Concrete:
+            pass
+
+        assert not can_substitute(_Concrete, _Abstract)
+        _Abstract.register(_Concrete)
+        assert can_substitute(_Concrete, _Abstract)
+        assert can_substitute(Tuple[_Concrete], Tuple[_Abstract])
+
     def test_can_substitute_to_none_optional(self):
         assert can_substitute(None, Optional[str])
 
+    def test_can_substitute_many(self):
+        candidates = [DerivedClass1, BaseClass1, BaseClass2, None]
+        assert can_substitute_many(candidates, BaseClass1) == [True, True, False, False]
+        assert can_substitute_many(candidates, Optional[BaseClass1]) == [True, True, False, True]
+        assert can_substitute_many(candidates, Any) == [True, True, True, True]
+        assert can_substitute_many(candidates, None) == [False, False, False, True]
+
     def test_can_substitute_to_tuples(self):
         assert can_substitute(Tuple[DerivedClass1], Tuple[BaseClass1])
         assert can_substitute(Tuple[DerivedClass1], tuple)
@@ -69,6 +103,13 @@ class TestTypes:
         assert not can_substitute(Tuple[BaseClass1, BaseClass2], Tuple[DerivedClass1, DerivedClass2])
         assert not can_substitute(Tuple[BaseClass1, BaseClass2], Tuple[DerivedClass1, BaseClass2])
 
+    def test_can_substitute_to_variadic_tuples(self):
+        assert can_substitute(Tuple[DerivedClass1, ...], Tuple[BaseClass1, ...])
+        assert not can_substitute(Tuple[BaseClass1, ...], Tuple[DerivedClass1, ...])
+        assert can_substitute(Tuple[DerivedClass1, BaseClass1], Tuple[BaseClass1, ...])
+        assert not can_substitute(Tuple[DerivedClass1, BaseClass2], Tuple[BaseClass1, ...])
+        assert not can_substitute(Tuple[BaseClass1, ...], Tuple[BaseClass1, BaseClass1])
+
     def test_can_substitute_to_generic_class(self):
         assert can_substitute(GenericClass[int], GenericClass[T1])
         assert not can_substitute(GenericClass[T1], GenericClass[int])
@@ -80,22 +121,12 @@ class TestTypes:
         assert not can_substitute(DerivedGenericClass[int, str], GenericClass[int])
 
     def test_can_substitute_to_generic_class_bound(self):
-        TB = typing.TypeVar("TB", bound=BaseClass1)
-
-        class GenericClassBound(typing.Generic[TB]):
-            pass
-
         assert can_substitute(GenericClassBound[DerivedClass1], GenericClassBound[TB])
         assert not can_substitute(GenericClassBound[TB], GenericClassBound[DerivedClass1])
         assert can_substitute(GenericClassBound[DerivedClass1], GenericClassBound)
         assert not can_substitute(GenericClassBound, GenericClassBound[DerivedClass1])
 
     def test_can_substitute_to_generic_class_constraint(self):
-        TC = typing.TypeVar("TC", BaseClass1, int)
-
-        class GenericClassConstraint(typing.Generic[TC]):
-            pass
-
         assert can_substitute(GenericClassConstraint[BaseClass1], GenericClassConstraint[TC])
         assert not can_substitute(GenericClassConstraint[DerivedClass1], GenericClassConstraint[TC])
         assert not can_substitute(GenericClassConstraint[TC], GenericClassConstraint[DerivedClass1])
@@ -174,6 +205,19 @@ class TestTypes:
         assert advanced_isinstance(None, Optional[str])
         assert advanced_isinstance("", Optional[str])
 
+    def test_advanced_isinstance_none_to_class(self):
+        assert advanced_isinstance(None, type(None))
+        assert advanced_isinstance(None, object) is False
+        assert advanced_isinstance(None, BaseClass1) is False
+
+    def test_advanced_isinstance_none_to_union(self):
+        assert advanced_isinstance(None, typing.Union[object, int]) is False
+        assert advanced_isinstance(None, typing.Union[int, None])
+
+    def test_advanced_isinstance_none_to_tuple(self):
+        assert advanced_isinstance((None,), Tuple[object]) is False
+        assert advanced_isinstance((None, 1), Tuple[None, int])
+
     def test_advanced_isinstance_to_tuples(self):
         assert advanced_isinstance((DerivedClass1(),), Tuple[BaseClass1])
         assert advanced_isinstance((DerivedClass1(),), tuple)
@@ -181,6 +225,13 @@ class TestTypes:
         assert advanced_isinstance((DerivedClass1(), BaseClass2()), Tuple[BaseClass1, BaseClass2])
         assert not advanced_isinstance((BaseClass1(), BaseClass2()), Tuple[DerivedClass1, DerivedClass2])
         assert not advanced_isinstance((BaseClass1(), BaseClass2()), Tuple[DerivedClass1, BaseClass2])
+        assert not advanced_isinstance((DerivedClass1(),), Tuple[BaseClass1, BaseClass1])
+
+    def test_advanced_isinstance_to_variadic_tuples(self):
+        assert advanced_isinstance((), Tuple[BaseClass1, ...])
+        assert advanced_isinstance((DerivedClass1(),), Tuple[BaseClass1, ...])
+        assert advanced_isinstance((DerivedClass1(), BaseClass1()), Tuple[BaseClass1, ...])
+        assert not advanced_isinstance((DerivedClass1(), BaseClass2()), Tuple[BaseClass1, ...])
 
     def test_advanced_isinstance_to_generic_class(self):
         assert advanced_isinstance(GenericClass[int](), GenericClass[T1])
@@ -189,27 +240,16 @@ class TestTypes:
         assert not advanced_isinstance(GenericClass[str](), GenericClass[int])
 
     def test_advanced_isinstance_to_generic_subclass(self):
-        print(type(DerivedGenericClass[str, int]()).__bases__)
         assert advanced_isinstance(DerivedGenericClass[str, int](), GenericClass[int])
         # Python erases type information by default.
         # TODO: Handle @generic_aware classes.
         assert advanced_isinstance(DerivedGenericClass[int, str](), GenericClass[int])
 
     def test_advanced_isinstance_to_generic_class_bound(self):
-        TB = typing.TypeVar("TB", bound=BaseClass1)
-
-        class GenericClassBound(typing.Generic[TB]):
-            pass
-
         assert advanced_isinstance(GenericClassBound[DerivedClass1](), GenericClassBound[TB])
         assert advanced_isinstance(GenericClassBound[DerivedClass1](), GenericClassBound)
 
     def test_advanced_isinstance_to_generic_class_constraint(self):
-        TC = typing.TypeVar("TC", BaseClass1, int)
-
-        class GenericClassConstraint(typing.Generic[TC]):
-            pass
-
         assert advanced_isinstance(GenericClassConstraint[BaseClass1](), GenericClassConstraint[TC])
         # Different from can_substitute due to type erasure!
         assert advanced_isinstance(GenericClassConstraint[DerivedClass1](), GenericClassConstraint[TC])
@@ -251,26 +291,26 @@ class TestTypes:
             typing.Callable[[BaseClass1], BaseClass2]
         )
 
-        def _fun3(arg: BaseClass1) -> BaseClass2:
+        def _fun4(arg: BaseClass1) -> BaseClass2:
             raise NotImplementedError()
 
         assert not advanced_isinstance(
-            _fun3,
+            _fun4,
             typing.Callable[[BaseClass1], DerivedClass2]
         )
 
-        def _fun4(arg: BaseClass1) -> DerivedClass2:
+        def _fun5(arg: BaseClass1) -> DerivedClass2:
             raise NotImplementedError()
 
         assert advanced_isinstance(
-            _fun4,
+            _fun5,
             typing.Callable[[DerivedClass1], BaseClass2]
         )
 
-        def _fun5(arg: DerivedClass1) -> BaseClass2:
+        def _fun6(arg: DerivedClass1) -> BaseClass2:
             raise NotImplementedError()
 
         assert not advanced_isinstance(
-            _fun5,
+            _fun6,
             typing.Callable[[BaseClass1], DerivedClass2]
         )